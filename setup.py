@@ -24,6 +24,12 @@ setup(
     install_requires=[
         "httpx>=0.24.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.8.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "compression": ["httpx[brotli,zstd]>=0.27.1"],
+        "uvloop": ["uvloop>=0.17.0; sys_platform != 'win32'"],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -4,8 +4,13 @@ Shiftai Agentic Infra Python SDK
 A Python client library for the Shiftai Agentic Infra REST API.
 """
 
-from .client import ShiftaiagenticinfraClient
+import logging
 
 __version__ = "0.0.6"
-__all__ = ["ShiftaiagenticinfraClient"]
+
+# Library logging stays silent unless the application configures a handler
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+from .client import ShiftaiagenticinfraClient, install_uvloop
+__all__ = ["ShiftaiagenticinfraClient", "install_uvloop"]
 
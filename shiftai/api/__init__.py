@@ -1,12 +1,28 @@
 """API classes for Communication Infrastructure."""
 
-from .platform_api import PlatformApi
-from .messages_api import MessagesApi
-from .users_api import UsersApi
-from .agents_api import AgentsApi
-from .analytics_api import AnalyticsApi
-from .conversations_api import ConversationsApi
-from .platform_session_api import PlatformSessionApi
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .platform_api import PlatformApi
+    from .messages_api import MessagesApi
+    from .users_api import UsersApi
+    from .agents_api import AgentsApi
+    from .analytics_api import AnalyticsApi
+    from .conversations_api import ConversationsApi
+    from .platform_session_api import PlatformSessionApi
+
+# API classes are imported on first access (PEP 562), so using one of them
+# does not pay the import cost of the others
+_SUBMODULES = {
+    "PlatformApi": "platform_api",
+    "MessagesApi": "messages_api",
+    "UsersApi": "users_api",
+    "AgentsApi": "agents_api",
+    "AnalyticsApi": "analytics_api",
+    "ConversationsApi": "conversations_api",
+    "PlatformSessionApi": "platform_session_api",
+}
 
 __all__ = [
     "PlatformApi",
@@ -18,3 +34,16 @@ __all__ = [
     "PlatformSessionApi",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
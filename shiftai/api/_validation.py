@@ -0,0 +1,48 @@
+"""
+Argument validation helpers shared by the API classes.
+Invalid input is rejected locally instead of after a round trip to the server.
+"""
+
+from typing import Any
+from uuid import UUID
+
+
+def as_uuid(value: Any, name: str) -> UUID:
+    """
+    Return value as a UUID, accepting UUID objects or their string form.
+
+    Args:
+        value: UUID or UUID string to validate
+        name: Argument name used in the error message
+
+    Returns:
+        The value as a UUID
+
+    Raises:
+        ValueError: If value is missing or not a valid UUID
+    """
+    if isinstance(value, UUID):
+        return value
+    if value is None:
+        raise ValueError(f"{name} is required")
+    try:
+        return UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        raise ValueError(f"{name} must be a valid UUID, got {value!r}") from None
+
+
+def require_nonblank(**fields: Any) -> None:
+    """
+    Check that every given string argument is non-empty and not just whitespace.
+
+    Fields are checked in the order given, so the first missing one is reported.
+
+    Args:
+        **fields: Argument values keyed by the argument name used in the error message
+
+    Raises:
+        ValueError: If any value is None, empty or whitespace only
+    """
+    for name, value in fields.items():
+        if not value or value.isspace():
+            raise ValueError(f"{name} is required")
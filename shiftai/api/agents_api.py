@@ -5,11 +5,13 @@ Provides methods for creating and managing AI agents.
 
 from typing import Optional, Dict, Any
 from ..http import HttpClient
-from ..models import CreateAgentRequest, Agent
+from ._validation import require_nonblank
+from ..models import Agent
 
 
 class AgentsApi:
     """API for agent operations."""
+    __slots__ = ("_http_client",)
     
     def __init__(self, http_client: HttpClient):
         self._http_client = http_client
@@ -39,19 +41,17 @@ class AgentsApi:
             ValueError: If name or platform is missing or empty, or API key is not configured
             ApiException: If the API request fails
         """
-        self._http_client.ensure_authenticated()
-
-        if not name or not name.strip():
-            raise ValueError("name is required")
-        if not platform or not platform.strip():
-            raise ValueError("platform is required")
+        require_nonblank(name=name, platform=platform)
         
-        request = CreateAgentRequest(
-            name=name,
-            platform=platform,
-            version=version,
-            metadata=metadata
-        )
+        # Same shape as CreateAgentRequest, built directly since it is only serialized
+        request = {
+            "name": name,
+            "platform": platform,
+        }
+        if version is not None:
+            request["version"] = version
+        if metadata is not None:
+            request["metadata"] = metadata
         
         return await self._http_client.post(
             "/api/agents",
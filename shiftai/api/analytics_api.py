@@ -3,11 +3,13 @@ API for analytics operations.
 Provides methods for submitting feedback and retrieving analytics data.
 """
 
+import asyncio
+import warnings
 from typing import Optional, Dict, Any, List
 from uuid import UUID
-from ..http import HttpClient
+from ..http import HttpClient, ResponseStream
+from ._validation import as_uuid, require_nonblank
 from ..models import (
-    FeedbackSubmissionRequest,
     FeedbackSubmissionResponse,
     FeedbackDTO,
     DashboardMetricsDTO,
@@ -15,11 +17,36 @@ from ..models import (
     TopUserDTO,
     UserAnalyticsDTO,
     ProjectAnalyticsResponseDTO,
+    AnalyticsBundle,
 )
 
+_TOP_AGENTS_PATH = "/api/analytics/top-agents"
+_TOP_USERS_PATH = "/api/analytics/top-users"
+_PROJECT_DATA_PATH = "/api/analytics/project-data"
+_ALL_PATH = "/api/analytics/all"
+
+
+def _message_feedback_path(message_id: UUID) -> str:
+    return f"/api/analytics/messages/{message_id}/feedback"
+
+
+def _legacy_rating(value: Optional[bool], legacy: Optional[bool], name: str, legacy_name: str) -> Optional[bool]:
+    """Resolve a rating passed under its pre-rename keyword (like/dislike)."""
+    if legacy is None:
+        return value
+    warnings.warn(
+        f"submit_feedback({legacy_name}=...) is deprecated, use {name}=... instead",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    if value is not None and value != legacy:
+        raise TypeError(f"Conflicting values for {name} and {legacy_name}")
+    return legacy
+
 
 class AnalyticsApi:
     """API for analytics operations."""
+    __slots__ = ("_http_client",)
     
     def __init__(self, http_client: HttpClient):
         self._http_client = http_client
@@ -32,6 +59,9 @@ class AnalyticsApi:
         liked: Optional[bool] = None,
         disliked: Optional[bool] = None,
         regeneration: Optional[bool] = None,
+        *,
+        like: Optional[bool] = None,
+        dislike: Optional[bool] = None,
     ) -> FeedbackSubmissionResponse:
         """
         Submit feedback for a BOT message (multiple feedback per message allowed).
@@ -45,37 +75,44 @@ class AnalyticsApi:
             liked: Like rating (optional)
             disliked: Dislike rating (optional)
             regeneration: User requested regeneration (optional)
+            like: Deprecated alias of liked
+            dislike: Deprecated alias of disliked
 
         Returns:
             FeedbackSubmissionResponse with feedbackId and submittedAt
 
         Raises:
-            ValueError: If message_id, feedback_title or feedback is missing
+            ValueError: If message_id is missing or not a valid UUID, or feedback_title or feedback is missing
+            TypeError: If a deprecated alias conflicts with its replacement
             ApiException: If the API request fails
         """
-        self._http_client.ensure_authenticated()
-
-        if message_id is None:
-            raise ValueError("message_id is required")
-        if not feedback_title or not feedback_title.strip():
-            raise ValueError("feedback_title is required")
-        if not feedback or not feedback.strip():
-            raise ValueError("feedback is required")
-
-        request = FeedbackSubmissionRequest(
-            messageId=message_id,
-            feedbackTitle=feedback_title.strip(),
-            feedback=feedback.strip(),
-            liked=liked,
-            disliked=disliked,
-            regeneration=regeneration,
-        )
-
-        return await self._http_client.post(
+        liked = _legacy_rating(liked, like, "liked", "like")
+        disliked = _legacy_rating(disliked, dislike, "disliked", "dislike")
+
+        message_id = as_uuid(message_id, "message_id")
+        require_nonblank(feedback_title=feedback_title, feedback=feedback)
+
+        # Same shape as FeedbackSubmissionRequest, built directly since it is only serialized
+        request = {
+            "messageId": message_id,
+            "feedbackTitle": feedback_title.strip(),
+            "feedback": feedback.strip(),
+        }
+        if liked is not None:
+            request["liked"] = liked
+        if disliked is not None:
+            request["disliked"] = disliked
+        if regeneration is not None:
+            request["regeneration"] = regeneration
+
+        response = await self._http_client.post(
             "/api/analytics/data",
             request,
             FeedbackSubmissionResponse,
         )
+        # New feedback changes the analytics aggregates
+        self._http_client.invalidate("/api/analytics")
+        return response
 
     async def get_message_feedback(self, message_id: UUID) -> List[FeedbackDTO]:
         """
@@ -90,18 +127,54 @@ class AnalyticsApi:
             List of FeedbackDTO, ordered by submittedAt descending
 
         Raises:
-            ValueError: If message_id is missing
+            ValueError: If message_id is missing or not a valid UUID
             ApiException: If the API request fails
         """
-        self._http_client.ensure_authenticated()
-
-        if message_id is None:
-            raise ValueError("message_id is required")
+        message_id = as_uuid(message_id, "message_id")
 
         return await self._http_client.get_list(
-            f"/api/analytics/messages/{message_id}/feedback",
+            _message_feedback_path(message_id),
             FeedbackDTO,
+            cache=True,
+        )
+
+    async def submit_feedback_and_fetch(
+        self,
+        message_id: UUID,
+        feedback_title: str,
+        feedback: str,
+        liked: Optional[bool] = None,
+        disliked: Optional[bool] = None,
+        regeneration: Optional[bool] = None,
+    ) -> List[FeedbackDTO]:
+        """
+        Submit feedback for a BOT message and return the message's updated feedback list.
+
+        The list is fetched after the submission has completed, so it includes
+        the new entry. Submitting invalidates the cached analytics, including
+        this list, so a cached copy from before the submission is never
+        returned; concurrent calls for the same message share one fetch.
+
+        Args:
+            message_id: The ID of the BOT message that received feedback (required)
+            feedback_title: Title for the feedback (required)
+            feedback: Feedback content (required)
+            liked: Like rating (optional)
+            disliked: Dislike rating (optional)
+            regeneration: User requested regeneration (optional)
+
+        Returns:
+            List of FeedbackDTO including the new entry, ordered by submittedAt descending
+
+        Raises:
+            ValueError: If message_id is missing or not a valid UUID, or feedback_title or feedback is missing
+            ApiException: If the API request fails
+        """
+        message_id = as_uuid(message_id, "message_id")
+        await self.submit_feedback(
+            message_id, feedback_title, feedback, liked, disliked, regeneration
         )
+        return await self.get_message_feedback(message_id)
 
     async def get_dashboard(self) -> DashboardMetricsDTO:
         """
@@ -112,11 +185,10 @@ class AnalyticsApi:
         Returns:
             DashboardMetricsDTO with dashboard metrics
         """
-        self._http_client.ensure_authenticated()
-
         return await self._http_client.get(
             "/api/analytics/dashboard",
-            DashboardMetricsDTO
+            DashboardMetricsDTO,
+            cache=True,
         )
     
     async def get_top_agents(self, limit: int = 5) -> List[TopAgentDTO]:
@@ -131,11 +203,11 @@ class AnalyticsApi:
         Returns:
             List of top agents
         """
-        self._http_client.ensure_authenticated()
-
         return await self._http_client.get_list(
-            f"/api/analytics/top-agents?limit={limit}",
-            TopAgentDTO
+            _TOP_AGENTS_PATH,
+            TopAgentDTO,
+            params={"limit": limit},
+            cache=True,
         )
     
     async def get_top_users(self, limit: int = 5) -> List[TopUserDTO]:
@@ -150,11 +222,11 @@ class AnalyticsApi:
         Returns:
             List of top users
         """
-        self._http_client.ensure_authenticated()
-
         return await self._http_client.get_list(
-            f"/api/analytics/top-users?limit={limit}",
-            TopUserDTO
+            _TOP_USERS_PATH,
+            TopUserDTO,
+            params={"limit": limit},
+            cache=True,
         )
     
     async def get_user_analytics(self) -> List[UserAnalyticsDTO]:
@@ -166,9 +238,26 @@ class AnalyticsApi:
         Returns:
             List of user analytics
         """
-        self._http_client.ensure_authenticated()
-
         return await self._http_client.get_list(
+            "/api/analytics/user-analytics",
+            UserAnalyticsDTO,
+            cache=True,
+        )
+    
+    def iter_user_analytics(self) -> ResponseStream[UserAnalyticsDTO]:
+        """
+        Stream the user analytics table, yielding rows as they are received.
+
+        GET /api/analytics/user-analytics
+
+        Use instead of get_user_analytics() for large projects to avoid holding
+        the full response in memory. Use `async with` on the stream when the
+        loop may stop early, so the connection is released right away.
+
+        Returns:
+            Stream of user analytics rows
+        """
+        return self._http_client.stream_list(
             "/api/analytics/user-analytics",
             UserAnalyticsDTO
         )
@@ -185,13 +274,43 @@ class AnalyticsApi:
         Returns:
             ProjectAnalyticsResponseDTO with project analytics
         """
-        self._http_client.ensure_authenticated()
-
         return await self._http_client.get(
-            f"/api/analytics/project-data?topLimit={top_limit}",
-            ProjectAnalyticsResponseDTO
+            _PROJECT_DATA_PATH,
+            ProjectAnalyticsResponseDTO,
+            params={"topLimit": top_limit},
+            cache=True,
         )
     
+    async def get_bundle(self, limit: int = 5, top_limit: int = 10) -> AnalyticsBundle:
+        """
+        Get dashboard, top agents, top users, user analytics and project data in one call.
+
+        The five GET requests are issued concurrently over the shared HTTP client,
+        so the total latency is roughly that of the slowest request rather than
+        the sum of all five.
+
+        Args:
+            limit: Maximum number of top agents/users to return (default: 5)
+            top_limit: Maximum number of top users/agents in project data (default: 10)
+
+        Returns:
+            AnalyticsBundle with all five results
+        """
+        dashboard, top_agents, top_users, user_analytics, project_data = await asyncio.gather(
+            self.get_dashboard(),
+            self.get_top_agents(limit),
+            self.get_top_users(limit),
+            self.get_user_analytics(),
+            self.get_project_data(top_limit),
+        )
+        return AnalyticsBundle(
+            dashboard=dashboard,
+            topAgents=top_agents,
+            topUsers=top_users,
+            userAnalytics=user_analytics,
+            projectData=project_data,
+        )
+
     async def get_all(self, top_limit: int = 5) -> Dict[str, Any]:
         """
         Get all analytics (admin - no auth required).
@@ -205,7 +324,8 @@ class AnalyticsApi:
             Dictionary with all analytics data
         """
         return await self._http_client.get_map_without_auth(
-            f"/api/analytics/all?topLimit={top_limit}"
+            _ALL_PATH,
+            params={"topLimit": top_limit}
         )
     
     async def initialize(self) -> Dict[str, Any]:
@@ -3,17 +3,44 @@ API for platform conversation operations.
 Provides methods for retrieving conversation messages and listing conversations.
 """
 
-from typing import List
+from typing import Dict, List, Optional
 from uuid import UUID
-from ..http import HttpClient
+from ..http import HttpClient, ResponseStream
+from ..http.batcher import MicroBatcher
+from ._validation import as_uuid, require_nonblank
 from ..models import ConversationMessageResponse, ConversationSummaryResponse
 
 
 class ConversationsApi:
     """API for platform conversation operations."""
+    __slots__ = ("_http_client", "_batcher")
     
     def __init__(self, http_client: HttpClient):
         self._http_client = http_client
+        self._batcher: Optional[MicroBatcher[UUID, List[ConversationMessageResponse]]] = None
+    
+    def enable_batching(self, max_delay: float = 0.005, max_batch_size: int = 50) -> None:
+        """
+        Coalesce concurrent get_messages_by_conversation_id calls into batched requests.
+        
+        Calls arriving within `max_delay` seconds of each other are sent as a single
+        POST /api/platform/conversation/getmessages-batch request, and each caller
+        receives the messages for its own conversation. Requires a server that
+        exposes the batch endpoint.
+        
+        Args:
+            max_delay: Maximum time in seconds a call waits for others to join its batch (default: 0.005)
+            max_batch_size: Maximum number of conversations per batch request (default: 50)
+        """
+        self._batcher = MicroBatcher(
+            self._get_messages_batch,
+            max_delay=max_delay,
+            max_batch_size=max_batch_size,
+        )
+    
+    def disable_batching(self) -> None:
+        """Send one request per get_messages_by_conversation_id call (the default)."""
+        self._batcher = None
     
     async def get_messages_by_conversation_id(
         self,
@@ -34,16 +61,17 @@ class ConversationsApi:
             List of simplified message responses for the conversation
             
         Raises:
-            ValueError: If conversation_id is missing or API key is not configured
+            ValueError: If conversation_id is missing or not a valid UUID, or API key is not configured
             ApiException: If the API request fails
         """
-        self._http_client.ensure_authenticated()
-
-        if conversation_id is None:
-            raise ValueError("conversation_id is required")
+        conversation_id = as_uuid(conversation_id, "conversation_id")
+        
+        if self._batcher is not None:
+            return await self._batcher.submit(conversation_id)
         
+        # UUIDs are encoded by the JSON serializer directly
         request = {
-            "conversationId": str(conversation_id)
+            "conversationId": conversation_id
         }
         
         return await self._http_client.post_list(
@@ -52,6 +80,70 @@ class ConversationsApi:
             ConversationMessageResponse
         )
     
+    def iter_messages_by_conversation_id(
+        self,
+        conversation_id: UUID
+    ) -> ResponseStream[ConversationMessageResponse]:
+        """
+        Stream the messages of a conversation, yielding each one as it is received.
+        
+        POST /api/platform/conversation/getmessages
+        
+        Use instead of get_messages_by_conversation_id() for long conversations to
+        avoid holding the full response in memory. Not affected by enable_batching().
+        Use `async with` on the stream when the loop may stop early, so the
+        connection is released right away.
+        
+        Args:
+            conversation_id: UUID of the conversation (required)
+            
+        Returns:
+            Stream of simplified message responses for the conversation
+            
+        Raises:
+            ValueError: If conversation_id is missing or not a valid UUID (raised on call),
+                or API key is not configured
+            ApiException: If the API request fails
+        """
+        conversation_id = as_uuid(conversation_id, "conversation_id")
+        
+        request = {
+            "conversationId": conversation_id
+        }
+        
+        return self._http_client.stream_post_list(
+            "/api/platform/conversation/getmessages",
+            request,
+            ConversationMessageResponse
+        )
+    
+    async def _get_messages_batch(
+        self,
+        conversation_ids: List[UUID]
+    ) -> List[List[ConversationMessageResponse]]:
+        """
+        Fetch messages for several conversations in one request.
+        
+        POST /api/platform/conversation/getmessages-batch
+        
+        Args:
+            conversation_ids: Conversation IDs collected by the batcher (may contain duplicates)
+            
+        Returns:
+            One list of messages per entry in conversation_ids, in the same order
+        """
+        unique_ids = list(dict.fromkeys(conversation_ids))
+        request = {
+            "conversationIds": unique_ids
+        }
+        
+        messages_by_id: Dict[str, List[ConversationMessageResponse]] = await self._http_client.post_grouped_list(
+            "/api/platform/conversation/getmessages-batch",
+            request,
+            ConversationMessageResponse
+        )
+        return [list(messages_by_id.get(str(conversation_id), [])) for conversation_id in conversation_ids]
+    
     async def get_all_conversations(
         self
     ) -> List[ConversationSummaryResponse]:
@@ -63,8 +155,6 @@ class ConversationsApi:
         Returns:
             List of conversation summaries with conversation ID, start time, and end time
         """
-        self._http_client.ensure_authenticated()
-
         return await self._http_client.get_list(
             "/api/platform/conversations/all",
             ConversationSummaryResponse
@@ -92,10 +182,7 @@ class ConversationsApi:
             ValueError: If username is missing or API key is not configured
             ApiException: If the API request fails
         """
-        self._http_client.ensure_authenticated()
-
-        if not username or not username.strip():
-            raise ValueError("username is required")
+        require_nonblank(username=username)
         
         request = {
             "username": username.strip()
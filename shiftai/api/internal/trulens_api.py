@@ -5,13 +5,17 @@ This is an internal/admin API for observability and quality assessment.
 Not part of normal client flows - use for monitoring and evaluation purposes only.
 """
 
-from typing import Dict, Any
+import asyncio
+from typing import Any, AsyncIterator, Callable, Dict, Optional
 from uuid import UUID
 from ...http import HttpClient
+from ...http.cache import MISSING
+from .._validation import as_uuid
 
 
 class EvalApi:
     """API for Eval metrics operations."""
+    __slots__ = ("_http_client",)
     
     def __init__(self, http_client: HttpClient):
         self._http_client = http_client
@@ -30,8 +34,11 @@ class EvalApi:
             
         Returns:
             Dictionary with processing status
+            
+        Raises:
+            ValueError: If conversation_id is missing or not a valid UUID
         """
-        self._http_client.ensure_authenticated()
+        conversation_id = as_uuid(conversation_id, "conversation_id")
 
         return await self._http_client.post_map(
             f"/api/eval/sessions/{conversation_id}/generate-metrics",
@@ -47,8 +54,6 @@ class EvalApi:
         Returns:
             Dictionary with processing status
         """
-        self._http_client.ensure_authenticated()
-
         return await self._http_client.post_map(
             "/api/eval/sessions/generate-metrics",
             {}
@@ -83,4 +88,74 @@ class EvalApi:
         return await self._http_client.get_map_without_auth(
             f"/api/eval/sessions/generate-metrics-all/{job_id}/progress"
         )
-
+    
+    def iter_batch_progress(
+        self,
+        job_id: str,
+        until: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        min_interval: float = 0.25,
+        max_interval: float = 5.0,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Poll progress for a batch metrics generation job, yielding each change.
+        
+        GET /api/eval/sessions/generate-metrics-all/{jobId}/progress
+        
+        Polls are conditional on the ETag of the last response, so unchanged
+        progress comes back as an empty 304; servers that send no ETag are
+        compared against the last progress instead. The interval between polls
+        doubles from min_interval up to max_interval while progress is unchanged
+        and drops back to min_interval whenever it changes.
+        
+        Args:
+            job_id: The job ID returned from generate_metrics_for_all_conversations
+            until: Optional predicate; iteration stops after yielding progress for which it returns True
+            min_interval: Delay in seconds before the next poll after a change
+            max_interval: Upper bound in seconds for the delay between polls
+            
+        Yields:
+            Dictionary with progress information, each time it changes
+            
+        Raises:
+            ValueError: If the intervals are not 0 < min_interval <= max_interval (raised on call)
+            ApiException: If a poll fails or returns a malformed body
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        return self._iter_batch_progress(job_id, until, min_interval, max_interval)
+    
+    async def _iter_batch_progress(
+        self,
+        job_id: str,
+        until: Optional[Callable[[Dict[str, Any]], bool]],
+        min_interval: float,
+        max_interval: float,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Polling loop behind iter_batch_progress(), which validates the arguments eagerly."""
+        path = f"/api/eval/sessions/generate-metrics-all/{job_id}/progress"
+        etag: Optional[str] = None
+        last: Any = MISSING
+        interval = min_interval
+        
+        while True:
+            response = await self._http_client.get_map_without_auth(
+                path,
+                headers={"If-None-Match": etag} if etag else None,
+                raw=True,
+            )
+            
+            progress = MISSING
+            if response.status_code != 304:
+                etag = response.headers.get("ETag")
+                progress = self._http_client.decode_json(response)
+            
+            if progress is MISSING or progress == last:
+                interval = min(interval * 2, max_interval)
+            else:
+                last = progress
+                yield progress
+                if until is not None and until(progress):
+                    return
+                interval = min_interval
+            
+            await asyncio.sleep(interval)
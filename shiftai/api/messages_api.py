@@ -3,9 +3,16 @@ API for platform message operations.
 Provides methods for submitting messages and retrieving message history.
 """
 
-from typing import Optional, Dict, Any, List
+import asyncio
+import copy
+import functools
+import math
+from typing import Optional, Dict, Any, List, Iterable, Callable, Awaitable, TypeVar
 from uuid import UUID
-from ..http import HttpClient
+from ..http import HttpClient, NotFoundException, ResponseStream
+from ..http.batcher import MicroBatcher
+from ..http.cache import MISSING, TTLCache
+from ._validation import as_uuid, require_nonblank
 from ..models import (
     PlatformMessageSubmissionRequest,
     PlatformMessageSubmissionResponse,
@@ -13,12 +20,87 @@ from ..models import (
     AgentData,
 )
 
+T = TypeVar('T')
+
+_MESSAGES_PATH = "/api/platform/messages"
+_SUBMIT_PATH = "/api/platform/messages/submit"
+_SUBMIT_BATCH_PATH = "/api/platform/messages/submit:batch"
+# Path templates as bound str.format methods, created once at import
+_message_path = "/api/platform/messages/{}".format
+_agent_messages_path = "/api/platform/messages/agent/{}".format
+
+
+def _agent_data(
+    name: str,
+    platform: str,
+    version: Optional[str],
+    metadata: Optional[Dict[str, Any]],
+) -> AgentData:
+    """Build the agentData of a message, reusing one instance per agent when it has no metadata."""
+    if metadata is None:
+        return _shared_agent_data(name, platform, version)
+    # Metadata dicts are mutable and unhashable, so those requests get their own instance
+    return AgentData(name=name, platform=platform, version=version, metadata=metadata)
+
+
+@functools.lru_cache(maxsize=64)
+def _shared_agent_data(name: str, platform: str, version: Optional[str]) -> AgentData:
+    # Only serialized, never modified, so one instance can back every request for the agent
+    return AgentData(name=name, platform=platform, version=version)
+
 
 class MessagesApi:
     """API for platform message operations."""
+    __slots__ = ("_http_client", "_post", "_post_list", "_get", "_get_list", "_batcher", "_id_cache", "_not_found")
     
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: HttpClient, cache_size: int = 0, not_found_ttl: float = 0.0):
+        """
+        Args:
+            http_client: Shared HTTP client
+            cache_size: Number of messages get_by_id keeps in an LRU cache (0 disables it)
+            not_found_ttl: Seconds get_by_id/get_by_agent remember a 404 before asking again (0 disables it)
+        """
         self._http_client = http_client
+        # Bound once, since these run on every request
+        self._post = http_client.post
+        self._post_list = http_client.post_list
+        self._get = http_client.get
+        self._get_list = http_client.get_list
+        self._batcher: Optional[
+            MicroBatcher[PlatformMessageSubmissionRequest, PlatformMessageSubmissionResponse]
+        ] = None
+        # Messages do not change once stored, so cached entries never expire
+        self._id_cache: Optional[TTLCache] = TTLCache(math.inf, cache_size) if cache_size else None
+        # Paths that recently returned 404, mapped to (message, response body) of the error
+        self._not_found = TTLCache(not_found_ttl, 1024)
+        # Both caches hold the current project's data; the HTTP client clears them on a key change
+        if self._id_cache is not None:
+            http_client.add_project_cache(self._id_cache)
+        http_client.add_project_cache(self._not_found)
+    
+    def enable_batching(self, max_delay: float = 0.005, max_batch_size: int = 50) -> None:
+        """
+        Coalesce concurrent message submissions into batched requests.
+        
+        Messages sent (via send_human_message, send_bot_message or submit) within
+        `max_delay` seconds of each other are posted as a single
+        POST /api/platform/messages/submit:batch request, and each caller
+        receives the response for its own message. Requires a server that
+        exposes the batch endpoint.
+        
+        Args:
+            max_delay: Maximum time in seconds a message waits for others to join its batch (default: 0.005)
+            max_batch_size: Maximum number of messages per batch request (default: 50)
+        """
+        self._batcher = MicroBatcher(
+            self._submit_batch,
+            max_delay=max_delay,
+            max_batch_size=max_batch_size,
+        )
+    
+    def disable_batching(self) -> None:
+        """Send one request per message (the default)."""
+        self._batcher = None
     
     async def send_human_message(
         self,
@@ -66,29 +148,18 @@ class MessagesApi:
             ValueError: If required fields are missing or API key is not configured
             ApiException: If the API request fails
         """
-        self._http_client.ensure_authenticated()
-
         # Validate required fields
-        if not username or not username.strip():
-            raise ValueError("username is required")
-        if not message or not message.strip():
-            raise ValueError("message is required")
-        if not agent_name or not agent_name.strip():
-            raise ValueError("agent_name is required")
-        if not agent_platform or not agent_platform.strip():
-            raise ValueError("agent_platform is required")
-        if not agent_version or not agent_version.strip():
-            raise ValueError("agent_version is required")
-        if not user_email or not user_email.strip():
-            raise ValueError("user_email is required")
+        require_nonblank(
+            username=username,
+            message=message,
+            agent_name=agent_name,
+            agent_platform=agent_platform,
+            agent_version=agent_version,
+            user_email=user_email,
+        )
 
         # Build agent data
-        agent_data = AgentData(
-            name=agent_name,
-            platform=agent_platform,
-            version=agent_version,
-            metadata=agent_metadata
-        )
+        agent_data = _agent_data(agent_name, agent_platform, agent_version, agent_metadata)
         
         # Build request
         request = PlatformMessageSubmissionRequest(
@@ -107,11 +178,7 @@ class MessagesApi:
             mode=mode
         )
         
-        return await self._http_client.post(
-            "/api/platform/messages/submit",
-            request,
-            PlatformMessageSubmissionResponse
-        )
+        return await self._submit(request)
     
     async def send_bot_message(
         self,
@@ -162,33 +229,21 @@ class MessagesApi:
             ValueError: If required fields are missing or API key is not configured
             ApiException: If the API request fails
         """
-        self._http_client.ensure_authenticated()
-
         # Validate required fields
-        if not username or not username.strip():
-            raise ValueError("username is required")
-        if not message or not message.strip():
-            raise ValueError("message is required")
-        if not agent_name or not agent_name.strip():
-            raise ValueError("agent_name is required")
-        if not agent_platform or not agent_platform.strip():
-            raise ValueError("agent_platform is required")
+        require_nonblank(
+            username=username,
+            message=message,
+            agent_name=agent_name,
+            agent_platform=agent_platform,
+        )
         if reply_message_id is None:
             raise ValueError("reply_message_id is required for bot messages")
-        if not rag_context or not rag_context.strip():
+        if not rag_context or rag_context.isspace():
             raise ValueError("rag_context is required for bot messages")
-        if not agent_version or not agent_version.strip():
-            raise ValueError("agent_version is required")
-        if not user_email or not user_email.strip():
-            raise ValueError("user_email is required")
+        require_nonblank(agent_version=agent_version, user_email=user_email)
 
         # Build agent data
-        agent_data = AgentData(
-            name=agent_name,
-            platform=agent_platform,
-            version=agent_version,
-            metadata=agent_metadata
-        )
+        agent_data = _agent_data(agent_name, agent_platform, agent_version, agent_metadata)
         
         # Build request
         request = PlatformMessageSubmissionRequest(
@@ -208,11 +263,7 @@ class MessagesApi:
             mode=mode
         )
         
-        return await self._http_client.post(
-            "/api/platform/messages/submit",
-            request,
-            PlatformMessageSubmissionResponse
-        )
+        return await self._submit(request)
     
     async def submit(
         self,
@@ -229,14 +280,86 @@ class MessagesApi:
         Returns:
             PlatformMessageSubmissionResponse with message ID and contextual prompt
         """
-        self._http_client.ensure_authenticated()
-
-        return await self._http_client.post(
-            "/api/platform/messages/submit",
+        return await self._submit(request)
+    
+    async def batch_submit(
+        self,
+        requests: List[PlatformMessageSubmissionRequest],
+        use_batch_endpoint: bool = True,
+    ) -> List[PlatformMessageSubmissionResponse]:
+        """
+        Submit several platform messages at once.
+        
+        POST /api/platform/messages/submit:batch
+        
+        The messages are sent in a single request. If the server has no batch
+        endpoint (404), or use_batch_endpoint is False, they are submitted
+        concurrently with one POST /api/platform/messages/submit each instead.
+        
+        Args:
+            requests: Message submission request objects
+            use_batch_endpoint: Try the batch endpoint first (default: True)
+            
+        Returns:
+            One PlatformMessageSubmissionResponse per request, in the same order
+            
+        Raises:
+            ApiException: If the API request fails
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+        
+        if use_batch_endpoint:
+            try:
+                return await self._submit_batch(requests)
+            except NotFoundException:
+                pass
+        
+        return list(await asyncio.gather(*(
+            self._post(
+                _SUBMIT_PATH,
+                request,
+                PlatformMessageSubmissionResponse
+            )
+            for request in requests
+        )))
+    
+    async def _submit(
+        self,
+        request: PlatformMessageSubmissionRequest
+    ) -> PlatformMessageSubmissionResponse:
+        """Submit one message, through the batcher if batching is enabled."""
+        if self._batcher is not None:
+            return await self._batcher.submit(request)
+        
+        return await self._post(
+            _SUBMIT_PATH,
             request,
             PlatformMessageSubmissionResponse
         )
     
+    async def _submit_batch(
+        self,
+        requests: List[PlatformMessageSubmissionRequest]
+    ) -> List[PlatformMessageSubmissionResponse]:
+        """
+        Submit several messages in one request.
+        
+        POST /api/platform/messages/submit:batch
+        
+        Args:
+            requests: Submission requests collected by the batcher
+            
+        Returns:
+            One response per request, in the same order
+        """
+        return await self._post_list(
+            _SUBMIT_BATCH_PATH,
+            requests,
+            PlatformMessageSubmissionResponse
+        )
+    
     async def get_all(self) -> List[PlatformMessage]:
         """
         Get all platform messages for the authenticated project.
@@ -246,31 +369,83 @@ class MessagesApi:
         Returns:
             List of all messages
         """
-        self._http_client.ensure_authenticated()
-
-        return await self._http_client.get_list(
-            "/api/platform/messages",
+        return await self._get_list(
+            _MESSAGES_PATH,
             PlatformMessage
         )
     
+    def iter_all(self) -> ResponseStream[PlatformMessage]:
+        """
+        Stream all platform messages for the authenticated project, yielding them as they are received.
+        
+        GET /api/platform/messages
+        
+        Use instead of get_all() for large message histories to avoid holding
+        the full response in memory. Use `async with` on the stream when the
+        loop may stop early, so the connection is released right away.
+        
+        Returns:
+            Stream of messages, in response order
+        """
+        return self._http_client.stream_list(_MESSAGES_PATH, PlatformMessage)
+    
     async def get_by_id(self, message_id: UUID) -> PlatformMessage:
         """
         Get platform message by ID.
         
         GET /api/platform/messages/{messageId}
         
+        Served from the in-process cache when the client was created with
+        message_cache_size > 0 and the message was fetched before. Each call
+        returns its own shallow copy; nested dicts are shared with the cache.
+        
         Args:
             message_id: UUID of the message
             
         Returns:
             The message object
+            
+        Raises:
+            ValueError: If message_id is missing or not a valid UUID
+            NotFoundException: If the message does not exist (possibly remembered from a recent lookup)
         """
-        self._http_client.ensure_authenticated()
+        message_id = as_uuid(message_id, "message_id")
+        if self._id_cache is not None:
+            cached = self._id_cache.get(message_id)
+            if cached is not MISSING:
+                # Each caller gets its own copy, so changes to a result do not reach the cache
+                return copy.copy(cached)
 
-        return await self._http_client.get(
-            f"/api/platform/messages/{message_id}",
+        api_key = self._http_client.api_key
+        message = await self._get_unless_not_found(
+            self._get,
+            _message_path(message_id),
             PlatformMessage
         )
+        # Not cached if the key (and so the project) changed while the request was in flight
+        if self._id_cache is not None and self._http_client.api_key == api_key:
+            self._id_cache.set(message_id, copy.copy(message))
+        return message
+    
+    async def get_many_by_id(self, message_ids: Iterable[UUID]) -> List[PlatformMessage]:
+        """
+        Get several platform messages by ID, fetching them concurrently.
+        
+        GET /api/platform/messages/{messageId} for each ID
+        
+        The requests are issued together (bounded by max_in_flight), so with
+        http2=True they share a single multiplexed connection.
+        
+        Args:
+            message_ids: UUIDs of the messages
+            
+        Returns:
+            The message objects, in the same order as message_ids
+            
+        Raises:
+            ApiException: If any of the requests fails
+        """
+        return list(await asyncio.gather(*(self.get_by_id(message_id) for message_id in message_ids)))
     
     async def get_by_agent(self, agent_id: UUID) -> List[PlatformMessage]:
         """
@@ -283,11 +458,58 @@ class MessagesApi:
             
         Returns:
             List of messages from the agent
+            
+        Raises:
+            ValueError: If agent_id is missing or not a valid UUID
+            NotFoundException: If the agent does not exist (possibly remembered from a recent lookup)
         """
-        self._http_client.ensure_authenticated()
-
-        return await self._http_client.get_list(
-            f"/api/platform/messages/agent/{agent_id}",
+        agent_id = as_uuid(agent_id, "agent_id")
+        return await self._get_unless_not_found(
+            self._get_list,
+            _agent_messages_path(agent_id),
             PlatformMessage
         )
+    
+    def iter_by_agent(self, agent_id: UUID) -> ResponseStream[PlatformMessage]:
+        """
+        Stream platform messages by agent, yielding them as they are received.
+        
+        GET /api/platform/messages/agent/{agentId}
+        
+        Use instead of get_by_agent() for agents with long histories to avoid
+        holding the full response in memory. Use `async with` on the stream when
+        the loop may stop early, so the connection is released right away.
+        
+        Args:
+            agent_id: UUID of the agent
+            
+        Returns:
+            Stream of messages from the agent, in response order
+            
+        Raises:
+            ValueError: If agent_id is missing or not a valid UUID (raised on call)
+        """
+        agent_id = as_uuid(agent_id, "agent_id")
+        return self._http_client.stream_list(_agent_messages_path(agent_id), PlatformMessage)
+    
+    async def _get_unless_not_found(self, get: Callable[..., Awaitable[T]], path: str, response_type: type) -> T:
+        """
+        GET path, failing fast if it returned 404 within the last not_found_ttl seconds.
+        
+        Args:
+            get: HttpClient method to send the request with (get or get_list)
+            path: API path
+            response_type: Response or element type passed to get
+        """
+        cached = self._not_found.get(path)
+        if cached is not MISSING:
+            raise NotFoundException(*cached)
+        
+        api_key = self._http_client.api_key
+        try:
+            return await get(path, response_type)
+        except NotFoundException as e:
+            if self._http_client.api_key == api_key:
+                self._not_found.set(path, (e.args[0], e.response_body))
+            raise
 
@@ -5,11 +5,13 @@ Provides methods for registering new projects and obtaining API keys.
 
 from typing import Optional, Dict, Any
 from ..http import HttpClient
+from ._validation import require_nonblank
 from ..models import PlatformRegistrationRequest, PlatformRegistrationResponse
 
 
 class PlatformApi:
     """API for platform registration operations."""
+    __slots__ = ("_http_client",)
     
     def __init__(self, http_client: HttpClient):
         self._http_client = http_client
@@ -35,8 +37,7 @@ class PlatformApi:
             ValueError: If project_name is missing or empty
             ApiException: If the API request fails
         """
-        if not project_name or not project_name.strip():
-            raise ValueError("project_name is required")
+        require_nonblank(project_name=project_name)
         
         request = PlatformRegistrationRequest(
             projectName=project_name,
@@ -8,14 +8,19 @@ from typing import Any, Dict, Optional
 from uuid import UUID
 
 from ..http import HttpClient
+from ._validation import as_uuid
 from ..models import EndConversationRequest, EndConversationResponse
 
 
 class PlatformSessionApi:
     """API for platform session operations."""
+    __slots__ = ("_http_client", "_post", "_post_map")
 
     def __init__(self, http_client: HttpClient):
         self._http_client = http_client
+        # Bound once, since these run on every request
+        self._post = http_client.post
+        self._post_map = http_client.post_map
 
     async def initiate_session(
         self,
@@ -37,8 +42,7 @@ class PlatformSessionApi:
         Returns:
             Dict[str, Any]: Raw response map returned by the endpoint.
         """
-        self._http_client.ensure_authenticated()
-        return await self._http_client.post_map("/api/platformsession/initiate", request or {})
+        return await self._post_map("/api/platformsession/initiate", request or {})
 
     async def end_conversation(self, conversation_id: UUID) -> EndConversationResponse:
         """
@@ -51,14 +55,14 @@ class PlatformSessionApi:
 
         Returns:
             EndConversationResponse containing success, message and timestamps.
-        """
-        self._http_client.ensure_authenticated()
 
-        if conversation_id is None:
-            raise ValueError("conversation_id is required")
+        Raises:
+            ValueError: If conversation_id is missing or not a valid UUID
+        """
+        conversation_id = as_uuid(conversation_id, "conversation_id")
 
         request = EndConversationRequest(conversationId=conversation_id)
-        return await self._http_client.post(
+        return await self._post(
             "/api/platformsession/endconversation",
             request,
             EndConversationResponse,
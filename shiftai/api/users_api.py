@@ -5,14 +5,18 @@ Provides methods for creating and managing users.
 
 from typing import Optional, Dict, Any
 from ..http import HttpClient
+from ._validation import require_nonblank
 from ..models import CreateUserRequest, User
 
 
 class UsersApi:
     """API for user operations."""
+    __slots__ = ("_http_client", "_post")
     
     def __init__(self, http_client: HttpClient):
         self._http_client = http_client
+        # Bound once, since it runs on every request
+        self._post = http_client.post
     
     async def create(
         self,
@@ -37,12 +41,7 @@ class UsersApi:
             ValueError: If username or email is missing or empty, or API key is not configured
             ApiException: If the API request fails
         """
-        self._http_client.ensure_authenticated()
-
-        if not username or not username.strip():
-            raise ValueError("username is required")
-        if not email or not email.strip():
-            raise ValueError("email is required")
+        require_nonblank(username=username, email=email)
         
         request = CreateUserRequest(
             username=username,
@@ -50,7 +49,7 @@ class UsersApi:
             metadata=metadata
         )
         
-        return await self._http_client.post(
+        return await self._post(
             "/api/users",
             request,
             User
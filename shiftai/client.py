@@ -3,32 +3,83 @@ Main client for Shiftai Agentic Infra SDK.
 Provides fluent API access to all platform operations.
 """
 
-from typing import Optional
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from . import api
 from .http import HttpClient
-from .api import (
-    PlatformApi,
-    MessagesApi,
-    UsersApi,
-    AgentsApi,
-    AnalyticsApi,
-    ConversationsApi,
-    PlatformSessionApi,
-)
-from .api.internal.trulens_api import EvalApi
+
+if TYPE_CHECKING:
+    from .models import PlatformMessageSubmissionResponse
+    from .api import (
+        PlatformApi,
+        MessagesApi,
+        UsersApi,
+        AgentsApi,
+        AnalyticsApi,
+        ConversationsApi,
+        PlatformSessionApi,
+    )
+
+
+def install_uvloop() -> bool:
+    """
+    Make asyncio create uvloop event loops, if uvloop is installed.
+
+    uvloop's libuv-based loop speeds up the socket I/O behind every request.
+    The policy only applies to loops created afterwards, so call this before
+    asyncio.run() (or before your framework starts its loop), not from inside
+    a running loop.
+
+    Returns:
+        True if uvloop was installed, False if it is not available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 class InternalApi:
     """Internal API wrapper for admin/observability operations."""
     
     def __init__(self, http_client: HttpClient):
+        from .api.internal.trulens_api import EvalApi
+
         self.eval = EvalApi(http_client)
 
 
+# Subclient attribute name -> factory; each is imported and built on first access
+_SUBCLIENTS: Dict[str, Callable[["ShiftaiagenticinfraClient"], Any]] = {
+    "platform": lambda client: api.PlatformApi(client._http_client),
+    "messages": lambda client: api.MessagesApi(
+        client._http_client,
+        cache_size=client._message_cache_size,
+        not_found_ttl=client._not_found_ttl,
+    ),
+    "users": lambda client: api.UsersApi(client._http_client),
+    "agents": lambda client: api.AgentsApi(client._http_client),
+    "analytics": lambda client: api.AnalyticsApi(client._http_client),
+    "conversations": lambda client: api.ConversationsApi(client._http_client),
+    "platform_session": lambda client: api.PlatformSessionApi(client._http_client),
+    "internal": lambda client: InternalApi(client._http_client),
+}
+
+
 class ShiftaiagenticinfraClient:
     """
     Main client for Shiftai Agentic Infra SDK.
     
-    Thread-safe: All API instances are stateless.
+    All API objects share one HTTP client with a keep-alive connection pool,
+    so connections (and their TLS handshakes) are reused across calls. Create
+    one client per process or application, reuse it for every request, and
+    close it once on shutdown; creating a client per request opens a new
+    connection every time. Use it from a single event loop.
     
     Usage:
         # For public operations (platform registration)
@@ -48,29 +99,90 @@ class ShiftaiagenticinfraClient:
             agent_name="Bot",
             agent_platform="OpenAI"
         )
+    
+    API subclients are created the first time they are accessed.
     """
     
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
+    platform: "PlatformApi"
+    messages: "MessagesApi"
+    users: "UsersApi"
+    agents: "AgentsApi"
+    analytics: "AnalyticsApi"
+    conversations: "ConversationsApi"
+    platform_session: "PlatformSessionApi"
+    internal: InternalApi
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        max_in_flight: int = 100,
+        cache_ttl: float = 0.0,
+        cache_maxsize: int = 128,
+        http2: bool = False,
+        message_cache_size: int = 0,
+        not_found_ttl: float = 0.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout: Optional[httpx.Timeout] = None,
+    ):
         """
         Initialize the SDK client.
         
         Args:
             base_url: Base URL of the API (e.g., "http://localhost:8081")
             api_key: Optional API key for authentication (required for most operations)
+            limits: Optional httpx connection pool limits for the shared HTTP client
+            max_in_flight: Maximum number of requests sent concurrently (default: 100)
+            cache_ttl: Seconds to cache analytics read responses (default: 0, caching disabled)
+            cache_maxsize: Maximum number of cached responses (default: 128)
+            http2: Use HTTP/2 multiplexing for concurrent requests (requires the "http2" extra)
+            message_cache_size: Number of messages messages.get_by_id keeps in memory (default: 0, disabled)
+            not_found_ttl: Seconds messages.get_by_id/get_by_agent remember a 404 (default: 0, disabled)
+            transport: Optional httpx transport to send requests through, e.g. a preconfigured
+                httpx.AsyncHTTPTransport or an httpx.MockTransport in tests (limits and http2 are
+                then configured on the transport instead)
+            timeout: Optional httpx request timeouts (default: 60s, 30s to connect)
         """
         if not base_url:
             raise ValueError("baseUrl is required")
         
-        self.api_key = api_key
-        self._http_client = HttpClient(base_url, api_key)
-        self.platform = PlatformApi(self._http_client)
-        self.messages = MessagesApi(self._http_client)
-        self.users = UsersApi(self._http_client)
-        self.agents = AgentsApi(self._http_client)
-        self.analytics = AnalyticsApi(self._http_client)
-        self.conversations = ConversationsApi(self._http_client)
-        self.platform_session = PlatformSessionApi(self._http_client)
-        self.internal = InternalApi(self._http_client)
+        self._http_client = HttpClient(
+            base_url,
+            api_key,
+            limits=limits,
+            max_in_flight=max_in_flight,
+            cache_ttl=cache_ttl,
+            cache_maxsize=cache_maxsize,
+            http2=http2,
+            transport=transport,
+            timeout=timeout,
+        )
+        self._message_cache_size = message_cache_size
+        self._not_found_ttl = not_found_ttl
+
+    @property
+    def api_key(self) -> Optional[str]:
+        """API key sent with authenticated requests."""
+        return self._http_client.api_key
+
+    @api_key.setter
+    def api_key(self, api_key: Optional[str]) -> None:
+        # Changing the key clears the response cache, so responses fetched for the
+        # previous key's project are never served under the new one
+        self._http_client.api_key = api_key
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set yet: build API subclients on first use
+        factory = _SUBCLIENTS.get(name)
+        if factory is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        subclient = factory(self)
+        setattr(self, name, subclient)
+        return subclient
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_SUBCLIENTS))
 
     def _ensure_api_key(self) -> None:
         """
@@ -86,8 +198,78 @@ class ShiftaiagenticinfraClient:
                 "or obtain one by registering a platform first."
             )
     
+    async def start_session_with_message(
+        self,
+        session_request: Optional[Dict[str, Any]] = None,
+        **message_kwargs: Any,
+    ) -> Tuple[Dict[str, Any], "PlatformMessageSubmissionResponse"]:
+        """
+        Initiate a session and send the first human message concurrently.
+
+        Equivalent to awaiting platform_session.initiate_session() and then
+        messages.send_human_message(), but both requests are in flight at the
+        same time, so the pair costs about one round trip instead of two. The
+        server may process them in either order; use the sequential calls if the
+        message must be sent after the session exists (e.g. when it needs the
+        session's conversation ID).
+
+        Args:
+            session_request: Optional raw request body for initiate_session
+            **message_kwargs: Arguments for messages.send_human_message
+
+        Returns:
+            Tuple of (initiate_session response, send_human_message response)
+
+        Raises:
+            ValueError: If required message fields are missing or API key is not configured
+            ApiException: If either request fails. If the message fails, the session
+                request is cancelled; if only the session fails, the message has already
+                been sent and is not rolled back.
+        """
+        session_task = asyncio.ensure_future(self.platform_session.initiate_session(session_request))
+        try:
+            message = await self.messages.send_human_message(**message_kwargs)
+        except BaseException:
+            session_task.cancel()
+            # Retrieve the task's outcome, so a session failure that already happened is not
+            # reported as "Task exception was never retrieved"
+            with contextlib.suppress(Exception, asyncio.CancelledError):
+                await session_task
+            raise
+        return await session_task, message
+
+    def set_max_in_flight(self, max_in_flight: int) -> None:
+        """
+        Change the concurrent request limit at runtime.
+
+        Args:
+            max_in_flight: New maximum number of concurrent requests
+        """
+        self._http_client.set_max_in_flight(max_in_flight)
+
+    def invalidate_cache(self, prefix: Optional[str] = None) -> None:
+        """
+        Drop cached GET responses, e.g. after a write the SDK does not know about.
+
+        Args:
+            prefix: Only drop responses for paths starting with this prefix (default: drop all)
+        """
+        self._http_client.invalidate(prefix)
+
+    async def warmup(self, timeout: float = 5.0) -> bool:
+        """
+        Establish a connection to the API before the first request.
+
+        Args:
+            timeout: Seconds to wait for the warm-up request
+
+        Returns:
+            True if a connection was established, False otherwise
+        """
+        return await self._http_client.warmup(timeout)
+
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client. Safe to call more than once."""
         await self._http_client.close()
     
     async def __aenter__(self):
@@ -8,9 +8,11 @@ from .exceptions import (
     ServerException,
 )
 from .http_client import HttpClient
+from .streaming import ResponseStream
 
 __all__ = [
     "HttpClient",
+    "ResponseStream",
     "ApiException",
     "UnauthorizedException",
     "BadRequestException",
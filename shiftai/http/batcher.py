@@ -0,0 +1,103 @@
+"""
+Asynchronous micro-batching.
+Coalesces calls arriving within a short window into a single batched call.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+from .exceptions import ApiException
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class MicroBatcher(Generic[K, V]):
+    """
+    Collect items submitted concurrently and flush them as one batch.
+
+    A batch is flushed when `max_delay` seconds have passed since its first
+    item arrived, or as soon as it holds `max_batch_size` items. Each caller
+    awaits the result for its own item.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[K]], Awaitable[List[V]]],
+        max_delay: float = 0.005,
+        max_batch_size: int = 50,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            flush: Coroutine function taking a list of items and returning one result per item, in order
+            max_delay: Maximum time in seconds an item waits for more items to join its batch
+            max_batch_size: Maximum number of items per batch
+        """
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self._flush = flush
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[K, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, item: K) -> V:
+        """
+        Add an item to the current batch and wait for its result.
+
+        Args:
+            item: Item to include in the next flush
+
+        Returns:
+            The result returned by the flush function for this item
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        """Start flushing the pending batch in a background task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[K, asyncio.Future]]) -> None:
+        """Flush one batch and resolve the futures of its callers."""
+        try:
+            results = await self._flush([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ApiException(0, f"Batch returned {len(results)} results for {len(batch)} items")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
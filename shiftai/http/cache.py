@@ -0,0 +1,88 @@
+"""
+In-process response cache.
+Stores already-deserialized response objects for a limited time.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+# Returned by TTLCache.get() on a miss, since None is a valid cached value
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire `ttl` seconds after being stored.
+
+    A ttl of 0 disables the cache: nothing is stored and every lookup misses.
+    """
+
+    def __init__(self, ttl: float = 0.0, maxsize: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Time in seconds an entry stays valid (0 disables caching)
+            maxsize: Maximum number of entries; the least recently used entry is evicted first
+        """
+        if ttl < 0:
+            raise ValueError("ttl must not be negative")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or MISSING if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            prefix: Only drop entries whose key starts with this path prefix (default: drop everything)
+        """
+        if prefix is None:
+            self._entries.clear()
+            return
+
+        for key in [k for k in self._entries if _key_path(k).startswith(prefix)]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _key_path(key: Hashable) -> str:
+    """Extract the request path from a cache key (a path string or a tuple starting with one)."""
+    if isinstance(key, tuple):
+        key = key[0]
+    return key if isinstance(key, str) else ""
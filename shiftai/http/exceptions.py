@@ -10,11 +10,14 @@ class ApiException(Exception):
         self.status_code = status_code
         self.response_body = response_body
         super().__init__(message)
+        # Formatted once, since logging may call str() on the same exception repeatedly
+        if response_body:
+            self._str = f"API error {status_code}: {message}\nResponse: {response_body}"
+        else:
+            self._str = f"API error {status_code}: {message}"
     
     def __str__(self):
-        if self.response_body:
-            return f"API error {self.status_code}: {super().__str__()}\nResponse: {self.response_body}"
-        return f"API error {self.status_code}: {super().__str__()}"
+        return self._str
 
 
 class UnauthorizedException(ApiException):
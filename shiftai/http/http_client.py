@@ -1,15 +1,43 @@
 """
 HTTP client for making async API calls.
-Thread-safe and stateless - can be shared across multiple threads.
+Keeps a connection pool, caches and in-flight requests; use it from a single event loop.
 """
 
+import asyncio
+import copy
+import logging
 import json
 import dataclasses
-from typing import TypeVar, Type, List, Dict, Any, Optional
+import functools
+import typing
+from collections import deque
+from typing import (
+    TypeVar,
+    Type,
+    List,
+    Dict,
+    Any,
+    Optional,
+    Deque,
+    AsyncIterator,
+    Awaitable,
+    Union,
+    Callable,
+    Tuple,
+    FrozenSet,
+)
 from datetime import datetime
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+from .. import __version__
+from .cache import MISSING, TTLCache
+from .streaming import ResponseStream, iter_json_array
 from .exceptions import (
     ApiException,
     UnauthorizedException,
@@ -20,34 +48,278 @@ from .exceptions import (
 
 T = TypeVar('T')
 
+logger = logging.getLogger(__name__)
+
+# Connection pool shared by every request made through one HttpClient.
+# Keep-alive connections are reused across calls so only the first request
+# to a host pays the TCP/TLS handshake.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=32,
+    keepalive_expiry=30.0,
+)
+
+# Request timeouts in seconds: generous for slow endpoints, shorter to connect.
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=30.0)
+
+# Default cap on concurrent requests, matching the pool's max_connections so
+# bursts queue here instead of thrashing the connection pool.
+DEFAULT_MAX_IN_FLIGHT = 100
+
+USER_AGENT = f"shiftai-sdk-python/{__version__} httpx/{httpx.__version__}"
+
+
+def _encode_body(request_body: Any) -> Optional[bytes]:
+    """
+    Serialize a request body (dataclass, dict or other JSON value) to JSON bytes.
+
+    Uses orjson when installed, which encodes dataclasses, UUIDs and datetimes
+    natively; otherwise falls back to the standard library json module.
+    """
+    if request_body is None:
+        return None
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(request_body, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib encoder handle them
+            pass
+
+    return json.dumps(request_body, default=_json_default).encode("utf-8")
+
+
+def _decode_body(content: bytes) -> Any:
+    """
+    Parse a JSON response body.
+
+    Uses orjson when installed; otherwise the standard library json module.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback for objects the stdlib encoder cannot handle (dataclasses, UUIDs, datetimes)."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # Shallow conversion: the encoder calls back here for nested dataclasses,
+        # avoiding the recursive deep copy made by dataclasses.asdict()
+        return {name: getattr(value, name) for name in _field_names(type(value))}
+    return str(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Return the field names of a dataclass, computed once per class."""
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def _parse_datetime(value: str) -> Any:
+    """Parse an ISO 8601 timestamp, returning the string unchanged if it is not one."""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+@functools.lru_cache(maxsize=128)
+def _known_fields(response_type: Any) -> Optional[FrozenSet[str]]:
+    """Return the dataclass field names of response_type, or None if it is not a dataclass."""
+    fields = getattr(response_type, '__dataclass_fields__', None)
+    return frozenset(fields) if fields is not None else None
+
+
+def _datetime_fields(response_type: Any) -> Tuple[str, ...]:
+    """Return the names of the dataclass fields of response_type annotated as (Optional) datetime."""
+    if not dataclasses.is_dataclass(response_type):
+        return ()
+    try:
+        hints = typing.get_type_hints(response_type)
+    except Exception:
+        return ()
+    return tuple(
+        name for name, hint in hints.items()
+        if name in response_type.__dataclass_fields__
+        and (hint is datetime or datetime in getattr(hint, '__args__', ()))
+    )
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    """Return a hashable, order-independent form of query parameters for cache keys."""
+    if not params:
+        return None
+    return tuple(sorted((k, str(v)) for k, v in params.items()))
+
+
+# Client errors with a dedicated exception type, looked up in _handle_error
+_STATUS_EXCEPTIONS: Dict[int, Type[ApiException]] = {
+    400: BadRequestException,
+    401: UnauthorizedException,
+    404: NotFoundException,
+}
+
+
+class _InFlightLimiter:
+    """
+    Admission gate allowing at most `limit` concurrent holders.
+
+    Unlike asyncio.Semaphore the limit can be changed while requests are
+    waiting: raising it admits queued waiters immediately, lowering it lets
+    in-flight requests drain before new ones are admitted.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed to us just before cancellation; pass it on
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self.active -= 1
+        self._wake()
+
+    def set_limit(self, limit: int) -> None:
+        self.limit = limit
+        self._wake()
+
+    def _wake(self) -> None:
+        # Hand free slots directly to waiters in FIFO order
+        while self._waiters and self.active < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
 
 class HttpClient:
     """HTTP client wrapper for making async API calls."""
     
-    def __init__(self, base_url: str, api_key: Optional[str]):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str],
+        limits: Optional[httpx.Limits] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        cache_ttl: float = 0.0,
+        cache_maxsize: int = 128,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout: Optional[httpx.Timeout] = None,
+    ):
         """
         Initialize HTTP client.
-        
+
+        The underlying httpx.AsyncClient is created once here and reused for
+        every request until close() is called.
+
         Args:
             base_url: Base URL of the API (e.g., "http://localhost:8081")
             api_key: Optional API key for authentication
+            limits: Optional connection pool limits (default: DEFAULT_LIMITS)
+            max_in_flight: Maximum number of requests sent concurrently (default: 100)
+            cache_ttl: Seconds to keep cacheable GET responses (default: 0, caching disabled)
+            cache_maxsize: Maximum number of cached responses (default: 128)
+            http2: Negotiate HTTP/2 so concurrent requests share one connection
+                (requires the "http2" extra; servers without HTTP/2 fall back to HTTP/1.1)
+            transport: Optional httpx transport to send requests through; when given, limits
+                and http2 are ignored and must be configured on the transport
+            timeout: Optional request timeouts (default: DEFAULT_TIMEOUT)
         """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        # Deserialized responses of GETs made with cache=True
+        self._cache = TTLCache(cache_ttl, cache_maxsize)
+        # Caches kept by API classes (see add_project_cache), cleared with _cache on a key change
+        self._project_caches: List[TTLCache] = []
+
         # Normalize baseUrl - remove trailing slash
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         
-        # Create httpx client with timeouts
+        # Create httpx client with timeouts and a keep-alive connection pool
         self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(60.0, connect=30.0),
+            # Request methods pass paths only; httpx joins them onto base_url
+            base_url=self.base_url,
+            timeout=timeout or DEFAULT_TIMEOUT,
+            limits=limits or DEFAULT_LIMITS,
+            http2=http2,
+            transport=transport,
+            # Accept-Encoding is left to httpx, which advertises exactly the
+            # decoders installed (br/zstd with the "compression" extra).
+            # Connections are kept alive by the pool without extra headers.
             headers={
                 "Content-Type": "application/json",
+                "User-Agent": USER_AGENT,
             }
         )
 
+        self._limiter = _InFlightLimiter(max_in_flight)
+        # Response decoders, built once per response type
+        self._decoders: Dict[Any, Callable[[Any], Any]] = {}
+        # GET requests currently in flight, keyed by (kind, path, ...), as [task, waiter count]
+        self._inflight: Dict[tuple, list] = {}
+        # Bumped whenever cached data is invalidated; responses to requests sent
+        # before that are not cached, since they may predate the change
+        self._generation = 0
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: Optional[str]) -> None:
+        if api_key != getattr(self, "_api_key", api_key):
+            # Cached and in-flight responses belong to the previous key's project;
+            # new GETs must not join requests still running under the old key
+            self._cache.invalidate()
+            for cache in self._project_caches:
+                cache.invalidate()
+            self._inflight.clear()
+            self._generation += 1
+        self._api_key = api_key
+        # Built once per key and passed on every authenticated request; httpx merges
+        # a Headers instance by copying its already-encoded items, skipping validation
+        self._auth_headers: Optional[httpx.Headers] = httpx.Headers({"Api-Key": api_key}) if api_key else None
+
+    def add_project_cache(self, cache: TTLCache) -> None:
+        """
+        Register a cache of per-project data kept outside this client, e.g. by an API class.
+
+        Registered caches are cleared together with the response cache whenever
+        api_key changes, so entries fetched for one project are never served for another.
+
+        Args:
+            cache: Cache to clear on key changes
+        """
+        self._project_caches.append(cache)
+
     def ensure_authenticated(self) -> None:
         """
         Ensure that an API key is available for authenticated operations.
 
+        Every authenticated request method (get, post, ...) performs this check
+        itself, so API classes do not need to call it first.
+
         Raises:
             ValueError: If no API key is configured
         """
@@ -58,8 +330,35 @@ class HttpClient:
                 "or obtain one by registering a platform first."
         )
     
+    async def warmup(self, timeout: float = 5.0) -> bool:
+        """
+        Open a pooled connection to the API ahead of the first real request.
+
+        Sends a cheap HEAD request to the base URL so the TCP/TLS handshake (and
+        HTTP/2 negotiation, if enabled) happens now rather than on the first call.
+        Any HTTP status counts as success; only connection failures are reported.
+
+        Args:
+            timeout: Seconds to wait for the warm-up request
+
+        Returns:
+            True if a connection was established, False otherwise
+        """
+        try:
+            await self._send("HEAD", "/", timeout=timeout)
+        except httpx.HTTPError as e:
+            logger.warning("Warm-up request to %s failed: %s", self.base_url, e)
+            return False
+        return True
+
+    @property
+    def is_closed(self) -> bool:
+        return self.client.is_closed
+
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and its connection pool; further calls are no-ops."""
+        if self.client.is_closed:
+            return
         await self.client.aclose()
     
     async def __aenter__(self):
@@ -68,6 +367,130 @@ class HttpClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
     
+    @property
+    def max_in_flight(self) -> int:
+        """Maximum number of requests sent concurrently."""
+        return self._limiter.limit
+
+    def set_max_in_flight(self, max_in_flight: int) -> None:
+        """
+        Change the concurrent request limit at runtime (e.g. to back off on 429s).
+
+        Raising the limit admits waiting requests immediately; lowering it does
+        not interrupt requests already in flight.
+
+        Args:
+            max_in_flight: New maximum number of concurrent requests
+
+        Raises:
+            ValueError: If max_in_flight is less than 1
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._limiter.set_limit(max_in_flight)
+
+    def invalidate(self, prefix: Optional[str] = None) -> None:
+        """
+        Drop cached GET responses, e.g. after a write that changes them.
+
+        GETs already in flight for matching paths are forgotten too, so later
+        identical GETs send a new request instead of joining one that may have
+        been answered before the write; responses to requests sent before the
+        invalidation are not cached.
+
+        Args:
+            prefix: Only drop responses for paths starting with this prefix (default: drop all)
+        """
+        self._cache.invalidate(prefix)
+        for key in [k for k in self._inflight if prefix is None or k[1].startswith(prefix)]:
+            del self._inflight[key]
+        self._generation += 1
+
+    def get_cached(
+        self,
+        path: str,
+        response_type: Any,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Look up a cached GET response without sending a request.
+
+        Args:
+            path: API path
+            response_type: Type the response was deserialized to (List[T] for get_list)
+            params: Query parameters of the cached request
+
+        Returns:
+            The cached value, or MISSING if there is none
+        """
+        return self._cache.get((path, _params_key(params), response_type))
+
+    def set_cached(
+        self,
+        path: str,
+        response_type: Any,
+        value: Any,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Store a value as the cached response of a GET request (no-op when caching is disabled).
+
+        Args:
+            path: API path
+            response_type: Type the response is deserialized to (List[T] for get_list)
+            value: Value later returned for matching cached GETs
+            params: Query parameters of the request
+        """
+        self._cache.set((path, _params_key(params), response_type), value)
+
+    def _cache_response(self, key: tuple, response: httpx.Response, value: Any) -> None:
+        """Cache a deserialized response unless the server asked not to."""
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control or "no-cache" in cache_control:
+            return
+        self._cache.set(key, value)
+
+    async def _single_flight(self, key: tuple, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fetch() unless an identical request is already in flight, in which case wait for that one.
+
+        The shared request is cancelled only when every caller waiting on it has been cancelled.
+        """
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(fetch())
+            entry = self._inflight[key] = [task, 0]
+
+            def _forget(done: asyncio.Future) -> None:
+                if self._inflight.get(key) is entry:
+                    del self._inflight[key]
+
+            task.add_done_callback(_forget)
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                entry[1] -= 1
+                if entry[1] == 0:
+                    # Forget the request before cancelling it, so an identical GET
+                    # arriving before the task finishes starts afresh instead of
+                    # joining a request that is being cancelled
+                    if self._inflight.get(key) is entry:
+                        del self._inflight[key]
+                    task.cancel()
+            raise
+
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, waiting for a free slot if max_in_flight requests are already running."""
+        await self._limiter.acquire()
+        try:
+            return await self.client.request(method, path, **kwargs)
+        finally:
+            self._limiter.release()
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Map HTTP status codes to custom exceptions."""
         status_code = response.status_code
@@ -76,29 +499,24 @@ class HttpClient:
         except Exception:
             response_body = None
         
-        if status_code == 401:
-            raise UnauthorizedException("Unauthorized", response_body)
-        elif status_code == 400:
-            raise BadRequestException("Bad Request", response_body)
-        elif status_code == 404:
-            raise NotFoundException("Not Found", response_body)
-        elif 500 <= status_code < 600:
+        exception_type = _STATUS_EXCEPTIONS.get(status_code)
+        if exception_type is not None:
+            raise exception_type(response_body=response_body)
+        if 500 <= status_code < 600:
             raise ServerException(status_code, "Server Error", response_body)
-        else:
-            raise ApiException(status_code, f"API request failed with status {status_code}", response_body)
+        raise ApiException(status_code, f"API request failed with status {status_code}", response_body)
     
-    def _deserialize_datetime(self, value: Any) -> Any:
-        """Deserialize datetime strings to datetime objects."""
-        if isinstance(value, str):
-            try:
-                return datetime.fromisoformat(value.replace('Z', '+00:00'))
-            except Exception:
-                pass
-        elif isinstance(value, dict):
-            return {k: self._deserialize_datetime(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self._deserialize_datetime(item) for item in value]
-        return value
+    def decode_json(self, response: httpx.Response) -> Any:
+        """
+        Parse the JSON body of a response obtained with raw=True.
+
+        Raises:
+            ApiException: If the body is not valid JSON
+        """
+        try:
+            return _decode_body(response.content)
+        except ValueError as e:
+            raise ApiException(0, f"Invalid JSON in response: {e}", response.text)
 
     def _filter_known_fields(self, data: Dict[str, Any], response_type: Type) -> Dict[str, Any]:
         """
@@ -107,97 +525,291 @@ class HttpClient:
         This provides similar functionality to Jackson's @JsonIgnoreProperties(ignoreUnknown = true)
         for Python dataclasses.
         """
-        if not hasattr(response_type, '__dataclass_fields__'):
+        known_fields = _known_fields(response_type)
+        if known_fields is None:
             return data
-
-        known_fields = set(response_type.__dataclass_fields__.keys())
         return {k: v for k, v in data.items() if k in known_fields}
 
-    async def get(self, path: str, response_type: Type[T]) -> T:
+    def _decoder(self, response_type: Type[T]) -> Callable[[Any], T]:
         """
-        Execute GET request with API key authentication.
+        Return the function converting parsed JSON into a response_type object.
+
+        Built once per type and reused for every response of that type.
+        """
+        decoder = self._decoders.get(response_type)
+        if decoder is None:
+            known_fields = _known_fields(response_type)
+            datetime_fields = _datetime_fields(response_type)
+
+            def decoder(data: Any) -> Any:
+                if isinstance(data, dict):
+                    # Filter to known fields to prevent TypeError on unknown fields
+                    if known_fields is not None:
+                        data = {k: v for k, v in data.items() if k in known_fields}
+                    # Only fields annotated as datetime are parsed; ISO strings elsewhere stay strings
+                    for name in datetime_fields:
+                        value = data.get(name)
+                        if isinstance(value, str):
+                            data[name] = _parse_datetime(value)
+                    return response_type(**data)
+                return data
+
+            self._decoders[response_type] = decoder
+        return decoder
+
+    def _list_decoder(self, element_type: Type[T]) -> Callable[[Any], List[T]]:
+        """Return the function converting a parsed JSON array into a list of element_type objects."""
+        key = List[element_type]
+        decoder = self._decoders.get(key)
+        if decoder is None:
+            decode_item = self._decoder(element_type)
+
+            def decoder(data: Any) -> List[Any]:
+                if not isinstance(data, list):
+                    raise ApiException(0, f"Expected list, got {type(data)}")
+                return [decode_item(item) for item in data]
+
+            self._decoders[key] = decoder
+        return decoder
+
+    def _grouped_list_decoder(self, element_type: Type[T]) -> Callable[[Any], Dict[str, List[T]]]:
+        """Return the function converting a parsed JSON object of arrays into a dict of element_type lists."""
+        key = Dict[str, List[element_type]]
+        decoder = self._decoders.get(key)
+        if decoder is None:
+            decode_item = self._decoder(element_type)
+
+            def decoder(data: Any) -> Dict[str, List[Any]]:
+                if not isinstance(data, dict):
+                    raise ApiException(0, f"Expected map, got {type(data)}")
+                result: Dict[str, List[Any]] = {}
+                for group, items in data.items():
+                    if not isinstance(items, list):
+                        raise ApiException(0, f"Expected list for key {group}, got {type(items)}")
+                    result[group] = [decode_item(item) for item in items]
+                return result
+
+            self._decoders[key] = decoder
+        return decoder
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        decode: Optional[Callable[[Any], Any]] = None,
+        *,
+        auth: bool = True,
+        body: Any = MISSING,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cache_key: Optional[tuple] = None,
+        raw: bool = False,
+        allow_not_modified: bool = False,
+    ) -> Any:
+        """
+        Send a request and return its decoded response body.
+
+        All request methods except the streaming ones go through here, so encoding,
+        authentication, error mapping and decoding live in one place.
 
         Args:
-            path: API path (e.g., "/api/platform/messages")
-            response_type: Expected response type class
+            method: HTTP method
+            path: API path
+            decode: Function applied to the parsed JSON body (default: return it as parsed)
+            auth: Send the Api-Key header (raises ValueError if no key is configured)
+            body: Request body to serialize as JSON (default: send no body)
+            params: Optional query parameters (URL-encoded by httpx)
+            headers: Optional request headers, for unauthenticated requests
+            cache_key: Store the decoded result in the response cache under this key
+            raw: Return the httpx.Response itself instead of its decoded body
+            allow_not_modified: With raw, return a 304 Not Modified response rather than raise it
 
         Returns:
-            Deserialized response object
+            Decoded response body, or the httpx.Response if raw is True
         """
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Api-Key": self.api_key,
-        }
+        if auth:
+            if not self.api_key:
+                self.ensure_authenticated()
+            headers = self._auth_headers
+
+        content = None if body is MISSING else _encode_body(body)
+        generation = self._generation
 
         try:
-            response = await self.client.get(url, headers=headers)
+            response = await self._send(method, path, headers=headers, params=params, content=content)
 
+            if allow_not_modified and response.status_code == 304:
+                return response
             if not response.is_success:
                 self._handle_error(response)
+            if raw:
+                return response
 
-            data = response.json()
-            # Handle datetime deserialization
-            data = self._deserialize_datetime(data)
+            data = _decode_body(response.content)
+            if decode is not None:
+                data = decode(data)
 
-            # Convert dict to response_type object
-            if isinstance(data, dict):
-                # Filter to known fields to prevent TypeError on unknown fields
-                filtered_data = self._filter_known_fields(data, response_type)
-                return response_type(**filtered_data)
+            # Skip caching if the API key changed or the cache was invalidated while the request was in flight
+            if cache_key is not None and generation == self._generation:
+                self._cache_response(cache_key, response, data)
             return data
-            
+
         except (UnauthorizedException, BadRequestException, NotFoundException, ServerException, ApiException):
             raise
         except Exception as e:
-            print(f"Error executing GET request to {path}: {e}")
+            logger.exception("Error executing %s request to %s", method, path)
             raise ApiException(0, f"IO error: {str(e)}")
-    
-    async def get_list(self, path: str, element_type: Type[T]) -> List[T]:
+
+    async def get(
+        self,
+        path: str,
+        response_type: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
+    ) -> T:
+        """
+        Execute GET request with API key authentication.
+
+        Args:
+            path: API path (e.g., "/api/platform/messages")
+            response_type: Expected response type class
+            params: Optional query parameters (URL-encoded by httpx)
+            cache: Serve from and store in the response cache (when cache_ttl > 0)
+
+        Returns:
+            Deserialized response object. Each caller gets its own shallow copy, so
+            coalesced and cached results are not shared; nested dicts and lists are.
+        """
+        if not self.api_key:
+            self.ensure_authenticated()
+        cache_key = (path, _params_key(params), response_type)
+        if cache:
+            cached = self._cache.get(cache_key)
+            if cached is not MISSING:
+                return copy.copy(cached)
+
+        # Identical concurrent GETs share one request; each caller (and the cache) gets its own object
+        result = await self._single_flight(
+            ("get",) + cache_key,
+            lambda: self._request(
+                "GET", path, self._decoder(response_type),
+                params=params, cache_key=cache_key if cache else None,
+            ),
+        )
+        return copy.copy(result)
+
+    async def get_list(
+        self,
+        path: str,
+        element_type: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
+    ) -> List[T]:
         """
         Execute GET request for List responses.
 
         Args:
             path: API path
             element_type: Expected element type class
+            params: Optional query parameters (URL-encoded by httpx)
+            cache: Serve from and store in the response cache (when cache_ttl > 0)
 
         Returns:
             List of deserialized response objects
         """
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Api-Key": self.api_key,
-        }
+        if not self.api_key:
+            self.ensure_authenticated()
+        cache_key = (path, _params_key(params), List[element_type])
+        if cache:
+            cached = self._cache.get(cache_key)
+            if cached is not MISSING:
+                return list(cached)
 
-        try:
-            response = await self.client.get(url, headers=headers)
+        # Identical concurrent GETs share one request; each caller (and the cache) gets its own list
+        result = await self._single_flight(
+            ("get_list",) + cache_key,
+            lambda: self._request(
+                "GET", path, self._list_decoder(element_type),
+                params=params, cache_key=cache_key if cache else None,
+            ),
+        )
+        return list(result)
 
-            if not response.is_success:
-                self._handle_error(response)
+    def stream_list(
+        self,
+        path: str,
+        element_type: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> ResponseStream[T]:
+        """
+        Execute GET request for List responses, yielding elements as they arrive.
 
-            data = response.json()
-            # Handle datetime deserialization
-            data = self._deserialize_datetime(data)
+        The response body is decoded incrementally, so only the element being
+        built is held in memory rather than the whole list. The request keeps
+        its connection and in-flight slot until the stream is exhausted or
+        closed; use `async with` on the returned stream when stopping early.
 
-            if not isinstance(data, list):
-                raise ApiException(0, f"Expected list, got {type(data)}")
+        Args:
+            path: API path
+            element_type: Expected element type class
+            params: Optional query parameters (URL-encoded by httpx)
+
+        Returns:
+            Stream of deserialized response objects, in response order
+        """
+        return ResponseStream(self._stream_list("GET", path, element_type, params=params))
+
+    def stream_post_list(self, path: str, request_body: Any, element_type: Type[T]) -> ResponseStream[T]:
+        """
+        Execute POST request for List responses, yielding elements as they arrive.
+
+        Streaming counterpart of post_list(); see stream_list() for how the body is decoded.
+
+        Args:
+            path: API path
+            request_body: Request body object (will be serialized to JSON)
+            element_type: Expected element type class
+
+        Returns:
+            Stream of deserialized response objects, in response order
+        """
+        return ResponseStream(self._stream_list("POST", path, element_type, body=request_body))
+
+    async def _stream_list(
+        self,
+        method: str,
+        path: str,
+        element_type: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = MISSING,
+    ) -> AsyncIterator[T]:
+        """Send the request behind stream_list() and stream_post_list(), decoding the JSON array incrementally."""
+        if not self.api_key:
+            self.ensure_authenticated()
+
+        content = None if body is MISSING else _encode_body(body)
+
+        await self._limiter.acquire()
+        try:
+            async with self.client.stream(
+                method, path, headers=self._auth_headers, params=params, content=content
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    self._handle_error(response)
+
+                decode = self._decoder(element_type)
+                async for item in iter_json_array(response.aiter_bytes()):
+                    yield decode(item)
 
-            # Convert list of dicts to list of objects
-            result = []
-            for item in data:
-                if isinstance(item, dict):
-                    # Filter to known fields to prevent TypeError on unknown fields
-                    filtered_item = self._filter_known_fields(item, element_type)
-                    result.append(element_type(**filtered_item))
-                else:
-                    result.append(item)
-            return result
-            
         except (UnauthorizedException, BadRequestException, NotFoundException, ServerException, ApiException):
             raise
         except Exception as e:
-            print(f"Error executing GET request to {path}: {e}")
+            logger.exception("Error executing %s request to %s", method, path)
             raise ApiException(0, f"IO error: {str(e)}")
-    
+        finally:
+            self._limiter.release()
+
     async def post(self, path: str, request_body: Any, response_type: Type[T]) -> T:
         """
         Execute POST request with API key authentication.
@@ -210,45 +822,7 @@ class HttpClient:
         Returns:
             Deserialized response object
         """
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Api-Key": self.api_key,
-        }
-        
-        # Serialize request body
-        if request_body is not None:
-            if dataclasses.is_dataclass(request_body):
-                # Use dataclasses.asdict() for proper nested serialization
-                json_body = json.dumps(dataclasses.asdict(request_body), default=str)
-            elif isinstance(request_body, dict):
-                json_body = json.dumps(request_body, default=str)
-            else:
-                json_body = json.dumps(request_body, default=str)
-        else:
-            json_body = None
-        
-        try:
-            response = await self.client.post(url, headers=headers, content=json_body)
-            
-            if not response.is_success:
-                self._handle_error(response)
-            
-            data = response.json()
-            # Handle datetime deserialization
-            data = self._deserialize_datetime(data)
-            
-            # Convert dict to response_type object
-            if isinstance(data, dict):
-                # Filter to known fields to prevent TypeError on unknown fields
-                filtered_data = self._filter_known_fields(data, response_type)
-                return response_type(**filtered_data)
-            return data
-            
-        except (UnauthorizedException, BadRequestException, NotFoundException, ServerException, ApiException):
-            raise
-        except Exception as e:
-            print(f"Error executing POST request to {path}: {e}")
-            raise ApiException(0, f"IO error: {str(e)}")
+        return await self._request("POST", path, self._decoder(response_type), body=request_body)
     
     async def post_list(self, path: str, request_body: Any, element_type: Type[T]) -> List[T]:
         """
@@ -262,52 +836,26 @@ class HttpClient:
         Returns:
             List of deserialized response objects
         """
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Api-Key": self.api_key,
-        }
-        
-        # Serialize request body
-        if request_body is not None:
-            if dataclasses.is_dataclass(request_body):
-                # Use dataclasses.asdict() for proper nested serialization
-                json_body = json.dumps(dataclasses.asdict(request_body), default=str)
-            elif isinstance(request_body, dict):
-                json_body = json.dumps(request_body, default=str)
-            else:
-                json_body = json.dumps(request_body, default=str)
-        else:
-            json_body = None
+        return await self._request("POST", path, self._list_decoder(element_type), body=request_body)
+    
+    async def post_grouped_list(
+        self,
+        path: str,
+        request_body: Any,
+        element_type: Type[T]
+    ) -> Dict[str, List[T]]:
+        """
+        Execute POST request for responses mapping keys to lists, with API key authentication.
         
-        try:
-            response = await self.client.post(url, headers=headers, content=json_body)
-            
-            if not response.is_success:
-                self._handle_error(response)
-            
-            data = response.json()
-            # Handle datetime deserialization
-            data = self._deserialize_datetime(data)
-            
-            if not isinstance(data, list):
-                raise ApiException(0, f"Expected list, got {type(data)}")
-            
-            # Convert list of dicts to list of objects
-            result: List[T] = []
-            for item in data:
-                if isinstance(item, dict):
-                    # Filter to known fields to prevent TypeError on unknown fields
-                    filtered_item = self._filter_known_fields(item, element_type)
-                    result.append(element_type(**filtered_item))
-                else:
-                    result.append(item)
-            return result
+        Args:
+            path: API path
+            request_body: Request body object (will be serialized to JSON)
+            element_type: Expected element type class of each list
             
-        except (UnauthorizedException, BadRequestException, NotFoundException, ServerException, ApiException):
-            raise
-        except Exception as e:
-            print(f"Error executing POST request to {path}: {e}")
-            raise ApiException(0, f"IO error: {str(e)}")
+        Returns:
+            Dictionary of key to list of deserialized response objects
+        """
+        return await self._request("POST", path, self._grouped_list_decoder(element_type), body=request_body)
     
     async def post_without_auth(self, path: str, request_body: Any, response_type: Type[T]) -> T:
         """
@@ -321,69 +869,41 @@ class HttpClient:
         Returns:
             Deserialized response object
         """
-        url = f"{self.base_url}{path}"
-        headers = {}
-        
-        # Serialize request body
-        if request_body is not None:
-            if dataclasses.is_dataclass(request_body):
-                # Use dataclasses.asdict() for proper nested serialization
-                json_body = json.dumps(dataclasses.asdict(request_body), default=str)
-            elif isinstance(request_body, dict):
-                json_body = json.dumps(request_body, default=str)
-            else:
-                json_body = json.dumps(request_body, default=str)
-        else:
-            json_body = None
-        
-        try:
-            response = await self.client.post(url, headers=headers, content=json_body)
-            
-            if not response.is_success:
-                self._handle_error(response)
-            
-            data = response.json()
-            # Handle datetime deserialization
-            data = self._deserialize_datetime(data)
-            
-            # Convert dict to response_type object
-            if isinstance(data, dict):
-                # Filter to known fields to prevent TypeError on unknown fields
-                filtered_data = self._filter_known_fields(data, response_type)
-                return response_type(**filtered_data)
-            return data
-            
-        except (UnauthorizedException, BadRequestException, NotFoundException, ServerException, ApiException):
-            raise
-        except Exception as e:
-            print(f"Error executing POST request to {path}: {e}")
-            raise ApiException(0, f"IO error: {str(e)}")
+        return await self._request("POST", path, self._decoder(response_type), auth=False, body=request_body)
     
-    async def get_map_without_auth(self, path: str) -> Dict[str, Any]:
+    async def get_map_without_auth(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+    ) -> Union[Dict[str, Any], httpx.Response]:
         """
         Execute GET request without auth, returning raw map.
         
         Args:
             path: API path
+            params: Optional query parameters (URL-encoded by httpx)
+            headers: Optional extra request headers (e.g. If-None-Match)
+            raw: Return the httpx.Response itself instead of its parsed body, so
+                 headers such as ETag are available; a 304 Not Modified is returned
+                 as-is rather than raised
             
         Returns:
-            Dictionary response
+            Dictionary response, or the httpx.Response if raw is True
         """
-        url = f"{self.base_url}{path}"
-        
-        try:
-            response = await self.client.get(url)
-            
-            if not response.is_success:
-                self._handle_error(response)
-            
-            return response.json()
-            
-        except (UnauthorizedException, BadRequestException, NotFoundException, ServerException, ApiException):
-            raise
-        except Exception as e:
-            print(f"Error executing GET request to {path}: {e}")
-            raise ApiException(0, f"IO error: {str(e)}")
+        if headers or raw:
+            # Conditional/raw requests depend on per-caller state, so they are never shared
+            return await self._request(
+                "GET", path, auth=False, params=params, headers=headers, raw=raw, allow_not_modified=raw
+            )
+
+        # Identical concurrent GETs share one request; each caller gets its own dict
+        result = await self._single_flight(
+            ("get_map_without_auth", path, _params_key(params)),
+            lambda: self._request("GET", path, auth=False, params=params),
+        )
+        return dict(result) if isinstance(result, dict) else result
     
     async def post_map_without_auth(self, path: str, request_body: Any = None) -> Dict[str, Any]:
         """
@@ -396,33 +916,7 @@ class HttpClient:
         Returns:
             Dictionary response
         """
-        url = f"{self.base_url}{path}"
-        
-        # Serialize request body
-        if request_body is not None:
-            if dataclasses.is_dataclass(request_body):
-                # Use dataclasses.asdict() for proper nested serialization
-                json_body = json.dumps(dataclasses.asdict(request_body), default=str)
-            elif isinstance(request_body, dict):
-                json_body = json.dumps(request_body, default=str)
-            else:
-                json_body = json.dumps(request_body, default=str)
-        else:
-            json_body = None
-        
-        try:
-            response = await self.client.post(url, content=json_body)
-            
-            if not response.is_success:
-                self._handle_error(response)
-            
-            return response.json()
-            
-        except (UnauthorizedException, BadRequestException, NotFoundException, ServerException, ApiException):
-            raise
-        except Exception as e:
-            print(f"Error executing POST request to {path}: {e}")
-            raise ApiException(0, f"IO error: {str(e)}")
+        return await self._request("POST", path, auth=False, body=request_body)
     
     async def post_map(self, path: str, request_body: Any = None) -> Dict[str, Any]:
         """
@@ -435,34 +929,55 @@ class HttpClient:
         Returns:
             Dictionary response
         """
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Api-Key": self.api_key,
-        }
-        
-        # Serialize request body
-        if request_body is not None:
-            if dataclasses.is_dataclass(request_body):
-                # Use dataclasses.asdict() for proper nested serialization
-                json_body = json.dumps(dataclasses.asdict(request_body), default=str)
-            elif isinstance(request_body, dict):
-                json_body = json.dumps(request_body, default=str)
-            else:
-                json_body = json.dumps(request_body, default=str)
-        else:
-            json_body = None
-        
-        try:
-            response = await self.client.post(url, headers=headers, content=json_body)
-            
-            if not response.is_success:
-                self._handle_error(response)
-            
-            return response.json()
-            
-        except (UnauthorizedException, BadRequestException, NotFoundException, ServerException, ApiException):
-            raise
-        except Exception as e:
-            print(f"Error executing POST request to {path}: {e}")
-            raise ApiException(0, f"IO error: {str(e)}")
+        return await self._request("POST", path, body=request_body)
+    
+    async def get_raw(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        auth: bool = True,
+    ) -> bytes:
+        """
+        Execute GET request, returning the undecoded response body.
+
+        For callers that forward the JSON payload as-is, which saves
+        parsing it only to serialize it again.
+
+        Args:
+            path: API path
+            params: Optional query parameters (URL-encoded by httpx)
+            auth: Send the Api-Key header (default: True)
+
+        Returns:
+            Raw response body bytes
+
+        Raises:
+            ApiException: On any non-2xx status, including 304 Not Modified
+        """
+        # Identical concurrent GETs share one request; bytes are immutable, so no copy is needed
+        return await self._single_flight(
+            ("get_raw", path, auth, _params_key(params)),
+            lambda: self._request_bytes("GET", path, auth=auth, params=params),
+        )
+
+    async def post_raw(self, path: str, request_body: Any = None, auth: bool = True) -> bytes:
+        """
+        Execute POST request, returning the undecoded response body.
+
+        Args:
+            path: API path
+            request_body: Optional request body (will be serialized to JSON)
+            auth: Send the Api-Key header (default: True)
+
+        Returns:
+            Raw response body bytes
+
+        Raises:
+            ApiException: On any non-2xx status, including 304 Not Modified
+        """
+        return await self._request_bytes("POST", path, auth=auth, body=request_body)
 
+    async def _request_bytes(self, method: str, path: str, **kwargs: Any) -> bytes:
+        """Send a request through _request() and return its body without decoding it; non-2xx statuses raise."""
+        response = await self._request(method, path, raw=True, **kwargs)
+        return response.content
@@ -0,0 +1,152 @@
+"""
+Incremental decoding of JSON array responses.
+Yields array elements as their bytes arrive instead of buffering the whole body.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncGenerator, AsyncIterator, Generic, List, TypeVar
+
+from .exceptions import ApiException
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+_SCALAR_TERMINATORS = frozenset(" \t\n\r,]")
+
+T = TypeVar('T')
+
+
+class _ArrayParser:
+    """Push parser for a top-level JSON array, fed with decoded text."""
+
+    def __init__(self):
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self._empty = True
+        self._expect_value = True
+
+    def feed(self, text: str, final: bool = False) -> List[Any]:
+        """
+        Add text and return the elements completed by it.
+
+        Args:
+            text: Next piece of the JSON document
+            final: True when no more text will follow
+
+        Raises:
+            ApiException: If the document is not a JSON array, or is incomplete when final
+        """
+        buffer = self._buffer + text
+        pos = 0
+        values = []
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer) or self._finished:
+                break
+
+            char = buffer[pos]
+            if not self._started:
+                if char != '[':
+                    raise ApiException(0, f"Expected list, got JSON starting with {char!r}")
+                self._started = True
+                pos += 1
+            elif char == ']' and (self._empty or not self._expect_value):
+                self._finished = True
+                pos += 1
+            elif char == ',' and not self._expect_value:
+                self._expect_value = True
+                pos += 1
+            elif not self._expect_value:
+                raise ApiException(0, f"Malformed JSON array: unexpected {char!r}")
+            else:
+                try:
+                    value, end = _DECODER.raw_decode(buffer, pos)
+                except ValueError as e:
+                    if final:
+                        raise ApiException(0, f"Malformed JSON array: {e}")
+                    # Element not complete yet; wait for more data
+                    break
+                if (
+                    not final
+                    and not isinstance(value, (dict, list, str))
+                    and (end == len(buffer) or buffer[end] not in _SCALAR_TERMINATORS)
+                ):
+                    # A number or literal is only complete once its terminator has arrived
+                    # (e.g. "-1." may still become "-1.5")
+                    break
+                values.append(value)
+                self._empty = False
+                self._expect_value = False
+                pos = end
+
+        # Keep only the unconsumed (partial) text
+        self._buffer = buffer[pos:]
+
+        if final:
+            if not self._finished:
+                raise ApiException(0, "Incomplete JSON array in response")
+            if self._buffer.strip(" \t\n\r"):
+                raise ApiException(0, "Unexpected data after JSON array in response")
+        return values
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """
+    Decode a top-level JSON array from a stream of byte chunks.
+
+    Each element is yielded as soon as it has been received completely, so
+    only the current element (not the whole document) is held in memory.
+
+    Args:
+        chunks: Async iterator of raw response body chunks
+
+    Yields:
+        Decoded array elements, in order
+
+    Raises:
+        ApiException: If the body is not a JSON array or is truncated/malformed
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    parser = _ArrayParser()
+
+    async for chunk in chunks:
+        for value in parser.feed(utf8.decode(chunk)):
+            yield value
+
+    for value in parser.feed(utf8.decode(b"", final=True), final=True):
+        yield value
+
+
+class ResponseStream(Generic[T]):
+    """
+    Async iterator over a streamed response that is also an async context manager.
+
+    The request holds a connection and an in-flight slot until the stream is
+    exhausted or closed. Iterating to the end closes it; a consumer that may stop
+    early should use `async with` (or call aclose()) so both are released at once
+    rather than when the stream is garbage collected.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: AsyncGenerator[T, None]):
+        self._items = items
+
+    def __aiter__(self) -> "ResponseStream[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._items.__anext__()
+
+    async def aclose(self) -> None:
+        """Close the response and release its in-flight slot. Safe to call more than once."""
+        await self._items.aclose()
+
+    async def __aenter__(self) -> "ResponseStream[T]":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
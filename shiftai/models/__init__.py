@@ -1,19 +1,24 @@
 """Model classes for request/response DTOs."""
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from uuid import UUID
 
+# Slotted instances have no per-instance __dict__, which roughly halves the
+# memory of large list responses; dataclass(slots=True) needs Python 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class PlatformRegistrationRequest:
     """Request for platform registration."""
     projectName: str
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PlatformRegistrationResponse:
     """Response from platform registration."""
     id: Optional[int] = None
@@ -24,7 +29,7 @@ class PlatformRegistrationResponse:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentData:
     """Agent information for message submission."""
     name: str
@@ -33,7 +38,7 @@ class AgentData:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PlatformMessageSubmissionRequest:
     """Request for submitting platform messages."""
     username: Optional[str] = None
@@ -55,14 +60,14 @@ class PlatformMessageSubmissionRequest:
     mode: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConversationMessage:
     """Simple DTO representing a conversation message with sender and message content."""
     sender: Optional[str] = None  # "HUMAN" or "BOT"
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WeaviateVector:
     """DTO representing a vector entry in Weaviate."""
     text: Optional[str] = None
@@ -78,7 +83,7 @@ class WeaviateVector:
     certainty: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PlatformMessageSubmissionResponse:
     """Response from platform message submission."""
     success: Optional[bool] = None
@@ -96,13 +101,13 @@ class PlatformMessageSubmissionResponse:
     cacheHit: Optional[bool] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EndConversationRequest:
     """Request DTO for ending a conversation session."""
     conversationId: UUID
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EndConversationResponse:
     """Response DTO for ending a conversation session."""
     success: Optional[bool] = None
@@ -112,7 +117,7 @@ class EndConversationResponse:
     endedAt: Optional[str] = None  # ISO 8601 datetime string
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CreateUserRequest:
     """Request for creating a user."""
     username: str
@@ -120,7 +125,7 @@ class CreateUserRequest:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class User:
     """User model."""
     userId: Optional[UUID] = None
@@ -130,7 +135,7 @@ class User:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CreateAgentRequest:
     """Request for creating an agent."""
     name: str
@@ -139,7 +144,7 @@ class CreateAgentRequest:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Agent:
     """Agent model."""
     id: Optional[UUID] = None
@@ -150,7 +155,7 @@ class Agent:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FeedbackSubmissionRequest:
     """Request for submitting feedback (multiple feedback per BOT message)."""
     messageId: UUID  # required - BOT message ID
@@ -161,7 +166,7 @@ class FeedbackSubmissionRequest:
     regeneration: Optional[bool] = None  # optional - Regeneration request
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FeedbackSubmissionResponse:
     """Response from feedback submission."""
     success: Optional[bool] = None
@@ -170,7 +175,7 @@ class FeedbackSubmissionResponse:
     submittedAt: Optional[str] = None  # ISO 8601 datetime string
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FeedbackDTO:
     """Single feedback entry for a BOT message (GET feedback list)."""
     id: Optional[UUID] = None  # Feedback entry ID
@@ -182,7 +187,7 @@ class FeedbackDTO:
     submittedAt: Optional[str] = None  # ISO 8601 datetime string
 
 
-@dataclass(init=False)
+@dataclass(init=False, **_SLOTS)
 class PlatformMessage:
     """Platform message model - matches backend JPA entity."""
 
@@ -227,22 +232,30 @@ class PlatformMessage:
 
     def __init__(self, **kwargs):
         """Custom init to handle extra backend fields gracefully."""
-        # Map backend field names to SDK field names
-        field_mapping = {
-            'sender': 'sender',  # Backend uses "sender"
-            'senderType': 'sender',  # Fallback for consistency
-        }
+        # Slotted classes keep no class-level defaults, so start from them explicitly
+        for name, default in _PLATFORM_MESSAGE_DEFAULTS:
+            setattr(self, name, default)
 
         for field_name, value in kwargs.items():
             # Apply field mapping if needed
-            sdk_field = field_mapping.get(field_name, field_name)
+            sdk_field = _PLATFORM_MESSAGE_FIELD_MAPPING.get(field_name, field_name)
 
             # Only set if field exists in dataclass
-            if hasattr(self, sdk_field):
+            if sdk_field in _PLATFORM_MESSAGE_FIELDS:
                 setattr(self, sdk_field, value)
 
 
-@dataclass
+# Computed once at import, since PlatformMessage.__init__ runs for every message of a list response
+_PLATFORM_MESSAGE_DEFAULTS = tuple((f.name, f.default) for f in fields(PlatformMessage))
+_PLATFORM_MESSAGE_FIELDS = frozenset(name for name, _ in _PLATFORM_MESSAGE_DEFAULTS)
+# Map backend field names to SDK field names
+_PLATFORM_MESSAGE_FIELD_MAPPING = {
+    'sender': 'sender',  # Backend uses "sender"
+    'senderType': 'sender',  # Fallback for consistency
+}
+
+
+@dataclass(**_SLOTS)
 class DashboardMetricsDTO:
     """Dashboard metrics DTO."""
     totalUsers: Optional[int] = None
@@ -256,7 +269,7 @@ class DashboardMetricsDTO:
     regenerates: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TopAgentDTO:
     """Top agent DTO."""
     rank: Optional[int] = None
@@ -266,7 +279,7 @@ class TopAgentDTO:
     satisfactionPercentage: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TopUserDTO:
     """Top user DTO."""
     rank: Optional[int] = None
@@ -277,7 +290,7 @@ class TopUserDTO:
     avgResponseTimeSeconds: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UserAnalyticsDTO:
     """User analytics DTO."""
     username: Optional[str] = None
@@ -291,7 +304,7 @@ class UserAnalyticsDTO:
     regenerates: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProjectAnalyticsResponseDTO:
     """Project analytics response DTO."""
     totalUsers: Optional[int] = None
@@ -307,7 +320,7 @@ class ProjectAnalyticsResponseDTO:
     topDevicesByUsage: Optional[List[Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConversationSummaryResponse:
     """Response object containing conversation summary information."""
     conversationId: Optional[UUID] = None
@@ -320,7 +333,7 @@ class ConversationSummaryResponse:
     conversationTitle: Optional[str] = None  # LLM-generated conversation title
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConversationMessageResponse:
     """Simplified message response for conversation messages.
 
@@ -358,4 +371,14 @@ class ConversationMessageResponse:
     evalSyncTimestamp: Optional[str] = None
     evalTotalTokens: Optional[int] = None
     evalTotalCost: Optional[float] = None
-    conversationTitle: Optional[str] = None  # LLM-generated conversation title
\ No newline at end of file
+    conversationTitle: Optional[str] = None  # LLM-generated conversation title
+
+
+@dataclass(**_SLOTS)
+class AnalyticsBundle:
+    """Client-side aggregate of the analytics reads a dashboard typically needs."""
+    dashboard: Optional[DashboardMetricsDTO] = None
+    topAgents: Optional[List[TopAgentDTO]] = None
+    topUsers: Optional[List[TopUserDTO]] = None
+    userAnalytics: Optional[List[UserAnalyticsDTO]] = None
+    projectData: Optional[ProjectAnalyticsResponseDTO] = None
@@ -0,0 +1,376 @@
+"""
+Shared fixtures for the SDK integration tests.
+
+The project registration and the authenticated client are created once per
+test session, so every test reuses the same pooled connections instead of
+registering a new project and opening new connections each time. The
+resources the flow creates (user, agent, messages, feedback) are session
+fixtures as well, so each step can be tested on its own.
+
+By default the session runs against an in-memory fake of the API
+(fake_server.py, served through httpx.MockTransport), so no network is
+needed. The same tests run against the real server with `pytest -m live`.
+"""
+
+import asyncio
+import dataclasses
+import importlib.util
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Tuple
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from shiftai import ShiftaiagenticinfraClient
+from shiftai.models import (
+    Agent,
+    FeedbackSubmissionResponse,
+    PlatformMessageSubmissionResponse,
+    PlatformRegistrationResponse,
+    User,
+)
+
+from fake_server import FakeServer
+
+
+BASE_URL = "https://api.theshiftai.in"
+
+# Enough idle connections for concurrent calls, kept open across the whole flow
+POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0)
+
+# Fail fast on a stalled connection instead of waiting for the SDK's 60s default
+REQUEST_TIMEOUT = httpx.Timeout(10.0, connect=5.0, pool=5.0)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Users and agents created per session, so the analytics reads rank more than one of each
+POPULATION_SIZE = 5
+
+AGENT_PLATFORM = "OpenAI"
+AGENT_VERSION = "4.0"
+
+# Metadata sent with the created resources; plain dicts so both JSON encoders accept them
+PROJECT_METADATA = {"environment": "test", "sdk_version": "1.0.0"}
+USER_METADATA = {"role": "developer", "department": "engineering"}
+AGENT_METADATA = {"model": "gpt-4", "temperature": 0.7}
+
+# Registered projects are reused by later local runs for this long; set
+# SHIFTAI_TESTS_NO_CACHE=1 (e.g. in CI) to register a fresh project every run.
+# The cache file stores the project's API key in plaintext, so it is created
+# readable by the owner only (0600).
+PROJECT_CACHE_TTL = 24 * 60 * 60
+PROJECT_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "shiftai-sdk-tests" / "project.json"
+)
+
+
+def email_for(username: str) -> str:
+    return f"{username}@example.com"
+
+
+def _read_project_cache() -> dict:
+    try:
+        cache = json.loads(PROJECT_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _cached_project(base_url: str) -> Optional[PlatformRegistrationResponse]:
+    """Return the project registered against base_url by a recent run, if any."""
+    entry = _read_project_cache().get(base_url)
+    try:
+        if time.time() - entry["cachedAt"] > PROJECT_CACHE_TTL:
+            return None
+        registration = PlatformRegistrationResponse(**entry["registration"])
+        if registration.createdAt:
+            registration.createdAt = datetime.fromisoformat(registration.createdAt)
+    except (KeyError, TypeError, ValueError):
+        # Missing, malformed or written by an older version of these tests: register anew
+        return None
+    return registration
+
+
+def _cache_project(base_url: str, registration: PlatformRegistrationResponse) -> None:
+    """Store the registration for later runs, replacing the cache file atomically."""
+    cache = _read_project_cache()
+    cache[base_url] = {
+        "cachedAt": time.time(),
+        "registration": dataclasses.asdict(registration),  # createdAt is stored via str()
+    }
+    PROJECT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = PROJECT_CACHE_FILE.with_name(f"{PROJECT_CACHE_FILE.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(cache, f, default=str)
+    os.replace(tmp, PROJECT_CACHE_FILE)
+
+
+async def register_project(
+    base_url: str,
+    project_name: str,
+    metadata: dict,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> PlatformRegistrationResponse:
+    """Register a new project through a short-lived unauthenticated client."""
+    async with ShiftaiagenticinfraClient(
+        base_url=base_url,
+        transport=transport,
+        timeout=REQUEST_TIMEOUT
+    ) as registration_client:
+        return await registration_client.platform.register(
+            project_name=project_name,
+            metadata=metadata
+        )
+
+
+async def ensure_project(base_url: str, project_name: str, metadata: dict) -> PlatformRegistrationResponse:
+    """Reuse the project registered by a recent run, or register a new one and remember it."""
+    use_cache = os.environ.get("SHIFTAI_TESTS_NO_CACHE") != "1"
+    if use_cache:
+        cached = _cached_project(base_url)
+        if cached is not None:
+            return cached
+
+    registration = await register_project(base_url, project_name, metadata)
+    if use_cache:
+        _cache_project(base_url, registration)
+    return registration
+
+
+@pytest.fixture(scope="session")
+def suffix() -> str:
+    """
+    Token appended to the names of everything the session creates.
+
+    Random rather than time based, so sessions started within the same second
+    (e.g. parallel pytest-xdist workers) do not collide.
+    """
+    return uuid.uuid4().hex[:8]
+
+
+@pytest.fixture(scope="session", params=["mock", pytest.param("live", marks=pytest.mark.live)])
+def backend(request: pytest.FixtureRequest) -> str:
+    """
+    Server the session runs against: "mock" (in-memory, the default) or "live".
+
+    Every test depends on it through the client, so each test runs once per
+    backend; `addopts` deselects the live variant unless `-m live` is given.
+    """
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def fake_server() -> FakeServer:
+    """In-memory API state shared by the mock backend's clients."""
+    return FakeServer()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def registration(suffix: str, backend: str, fake_server: FakeServer) -> PlatformRegistrationResponse:
+    """Project used by the whole test session (registered once, or reused from a recent live run)."""
+    project_name = f"sdk-test-project-{suffix}"
+    if backend == "mock":
+        return await register_project(BASE_URL, project_name, PROJECT_METADATA, transport=fake_server.transport())
+    return await ensure_project(BASE_URL, project_name=project_name, metadata=PROJECT_METADATA)
+
+
+@pytest.fixture(scope="session")
+def transport(backend: str, fake_server: FakeServer) -> httpx.AsyncBaseTransport:
+    """
+    Transport used by the authenticated client; closed together with it.
+
+    For the live backend this is a pooled transport. With h2 installed (the
+    "http2" extra, included in "dev"), concurrent reads are multiplexed as
+    HTTP/2 streams over one connection instead of one connection each.
+    """
+    if backend == "mock":
+        return fake_server.transport()
+    return httpx.AsyncHTTPTransport(limits=POOL_LIMITS, http2=HTTP2_AVAILABLE, retries=0)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(
+    registration: PlatformRegistrationResponse,
+    transport: httpx.AsyncBaseTransport,
+) -> AsyncIterator[ShiftaiagenticinfraClient]:
+    """
+    Client authenticated with the session's project API key, closed after the last test.
+
+    Its connection is opened with a throwaway HEAD request before any test uses
+    it, so the DNS lookup and TLS handshake are not timed as part of a test step.
+    Warm-up failures are ignored; the first real request then reports them.
+    """
+    client = ShiftaiagenticinfraClient(
+        base_url=BASE_URL,
+        api_key=registration.apiKey,
+        transport=transport,
+        timeout=REQUEST_TIMEOUT
+    )
+    await client.warmup()
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="session")
+def usernames(suffix: str) -> List[str]:
+    return [f"test-user-{suffix}-{i}" for i in range(POPULATION_SIZE)]
+
+
+@pytest.fixture(scope="session")
+def agent_names(suffix: str) -> List[str]:
+    return [f"TestAgent-{suffix}-{i}" for i in range(POPULATION_SIZE)]
+
+
+@pytest.fixture(scope="session")
+def username(usernames: List[str]) -> str:
+    """Name of the user the single-message steps are sent as."""
+    return usernames[0]
+
+
+@pytest.fixture(scope="session")
+def email(username: str) -> str:
+    return email_for(username)
+
+
+@pytest.fixture(scope="session")
+def agent_name(agent_names: List[str]) -> str:
+    """Name of the agent the single-message steps are sent to."""
+    return agent_names[0]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def users_and_agents(
+    client: ShiftaiagenticinfraClient,
+    usernames: List[str],
+    agent_names: List[str],
+) -> Tuple[List[User], List[Agent]]:
+    """Create the session's users and agents; they are independent, so all requests run concurrently."""
+    created = await asyncio.gather(
+        *(
+            client.users.create(
+                username=name,
+                email=email_for(name),
+                metadata=USER_METADATA
+            )
+            for name in usernames
+        ),
+        *(
+            client.agents.create(
+                name=name,
+                platform=AGENT_PLATFORM,
+                version=AGENT_VERSION,
+                metadata=AGENT_METADATA
+            )
+            for name in agent_names
+        ),
+    )
+    return list(created[:len(usernames)]), list(created[len(usernames):])
+
+
+@pytest.fixture(scope="session")
+def users(users_and_agents: Tuple[List[User], List[Agent]]) -> List[User]:
+    return users_and_agents[0]
+
+
+@pytest.fixture(scope="session")
+def agents(users_and_agents: Tuple[List[User], List[Agent]]) -> List[Agent]:
+    return users_and_agents[1]
+
+
+@pytest.fixture(scope="session")
+def user(users: List[User]) -> User:
+    return users[0]
+
+
+@pytest.fixture(scope="session")
+def agent(agents: List[Agent]) -> Agent:
+    return agents[0]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def population_messages(
+    client: ShiftaiagenticinfraClient,
+    users: List[User],
+    agents: List[Agent],
+) -> List[PlatformMessageSubmissionResponse]:
+    """
+    One human message from every user to every agent, sent concurrently.
+
+    User i also sends i extra messages to the first agent, so the users'
+    query counts differ and the analytics reads have a ranking to check.
+    """
+    async def send(user: User, agent: Agent) -> PlatformMessageSubmissionResponse:
+        return await client.messages.send_human_message(
+            username=user.username,
+            message="What are your opening hours?",
+            agent_name=agent.name,
+            agent_platform=AGENT_PLATFORM,
+            agent_version=AGENT_VERSION,
+            user_email=user.email
+        )
+
+    return list(await asyncio.gather(
+        *(send(user, agent) for user in users for agent in agents),
+        *(send(user, agents[0]) for i, user in enumerate(users) for _ in range(i)),
+    ))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def human_message(
+    client: ShiftaiagenticinfraClient,
+    user: User,
+    email: str,
+    agent: Agent,
+) -> PlatformMessageSubmissionResponse:
+    """Human message that starts the session's conversation."""
+    return await client.messages.send_human_message(
+        username=user.username,
+        message="Hello, I need help with my account.",
+        agent_name=agent.name,
+        agent_platform=AGENT_PLATFORM,
+        agent_version=AGENT_VERSION,
+        user_email=email,
+        intent="account_help"
+    )
+
+
+@pytest_asyncio.fixture(scope="session")
+async def bot_message(
+    client: ShiftaiagenticinfraClient,
+    user: User,
+    email: str,
+    agent: Agent,
+    human_message: PlatformMessageSubmissionResponse,
+) -> PlatformMessageSubmissionResponse:
+    """Bot reply to the session's human message."""
+    return await client.messages.send_bot_message(
+        username=user.username,
+        message="I'd be happy to help you with your account. What specific issue are you experiencing?",
+        agent_name=agent.name,
+        agent_platform=AGENT_PLATFORM,
+        reply_message_id=human_message.messageId,
+        rag_context="Retrieved context: Account management, billing, settings",
+        agent_version=AGENT_VERSION,
+        user_email=email
+    )
+
+
+@pytest_asyncio.fixture(scope="session")
+async def feedback(
+    client: ShiftaiagenticinfraClient,
+    bot_message: PlatformMessageSubmissionResponse,
+) -> FeedbackSubmissionResponse:
+    """Feedback on the session's bot message."""
+    return await client.analytics.submit_feedback(
+        message_id=bot_message.messageId,
+        feedback_title="Response Quality Feedback",
+        feedback="Great response, very helpful!",
+        liked=True,
+    )
@@ -0,0 +1,232 @@
+"""
+In-memory stand-in for the Shiftai Agentic Infra API.
+
+Used through httpx.MockTransport so the integration tests run without network
+access. Only the endpoints exercised by the tests are implemented; responses
+use the same JSON field names as the real server and reflect what the
+session has created so far.
+"""
+
+import json
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # installed with the "dev" extra; the stdlib is enough otherwise
+    orjson = None
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _loads(content: bytes) -> Any:
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def _respond(status_code: int, data: Any = None) -> httpx.Response:
+    """Build a JSON response, encoded with orjson when installed."""
+    if data is None:
+        return httpx.Response(status_code)
+    content = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+    return httpx.Response(status_code, content=content, headers={"Content-Type": "application/json"})
+
+
+class FakeServer:
+    """Stateful request handler for httpx.MockTransport."""
+
+    def __init__(self):
+        self.api_keys: Dict[str, str] = {}  # api key -> project name
+        self.users: Dict[str, Dict[str, Any]] = {}  # username -> user
+        self.agents: Dict[str, Dict[str, Any]] = {}  # agent name -> agent
+        self.messages: Dict[str, Dict[str, Any]] = {}  # message id -> message
+        self.feedback: List[Dict[str, Any]] = []
+
+    def transport(self) -> httpx.MockTransport:
+        """Return a new transport answering from this server's state."""
+        return httpx.MockTransport(self)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        method, path = request.method, request.url.path
+        body = _loads(request.content) if request.content else None
+
+        if method == "HEAD":
+            return _respond(200)
+        if method == "POST" and path == "/api/platform/register":
+            return self._register(body)
+
+        project = self.api_keys.get(request.headers.get("Api-Key", ""))
+        if project is None:
+            return _respond(401, {"message": "Invalid API key"})
+
+        if method == "POST":
+            if path == "/api/users":
+                return self._create_user(body, project)
+            if path == "/api/agents":
+                return self._create_agent(body, project)
+            if path == "/api/platform/messages/submit":
+                return self._submit_message(body)
+            if path == "/api/analytics/data":
+                return self._submit_feedback(body)
+            if path.startswith("/api/eval/sessions/") and path.endswith("/generate-metrics"):
+                return _respond(200, {"status": "STARTED", "conversationId": path.split("/")[4]})
+        elif method == "GET":
+            limit = int(request.url.params.get("limit", request.url.params.get("topLimit", 5)))
+            if path == "/api/analytics/dashboard":
+                return _respond(200, self._totals())
+            if path == "/api/analytics/project-data":
+                return _respond(200, {**self._totals(), "topUserActivity": self._top_users(limit)})
+            if path == "/api/analytics/top-agents":
+                return _respond(200, self._top_agents(limit))
+            if path == "/api/analytics/top-users":
+                return _respond(200, self._top_users(limit))
+            if path == "/api/analytics/user-analytics":
+                return _respond(200, self._user_analytics())
+            if path == "/api/platform/messages":
+                return _respond(200, list(self.messages.values()))
+            if path.startswith("/api/platform/messages/agent/"):
+                agent_id = path.rsplit("/", 1)[1]
+                return _respond(
+                    200, [m for m in self.messages.values() if m["agent"]["id"] == agent_id]
+                )
+            if path.startswith("/api/platform/messages/"):
+                message = self.messages.get(path.rsplit("/", 1)[1])
+                if message is None:
+                    return _respond(404, {"message": "Message not found"})
+                return _respond(200, message)
+
+        return _respond(404, {"message": f"No route for {method} {path}"})
+
+    def _register(self, body: Dict[str, Any]) -> httpx.Response:
+        api_key = f"pk_{uuid.uuid4().hex}"
+        self.api_keys[api_key] = body["projectName"]
+        return _respond(200, {
+            "id": len(self.api_keys),
+            "tenantId": str(uuid.uuid4()),
+            "projectName": body["projectName"],
+            "apiKey": api_key,
+            "createdAt": _now(),
+            "message": "Platform registered successfully",
+        })
+
+    def _create_user(self, body: Dict[str, Any], project: str) -> httpx.Response:
+        user = {
+            "userId": str(uuid.uuid4()),
+            "username": body["username"],
+            "email": body["email"],
+            "projectName": project,
+            "metadata": body.get("metadata"),
+        }
+        self.users[user["username"]] = user
+        return _respond(200, user)
+
+    def _create_agent(self, body: Dict[str, Any], project: str) -> httpx.Response:
+        agent = {
+            "id": str(uuid.uuid4()),
+            "name": body["name"],
+            "platform": body["platform"],
+            "version": body.get("version"),
+            "projectName": project,
+            "metadata": body.get("metadata"),
+        }
+        self.agents[agent["name"]] = agent
+        return _respond(200, agent)
+
+    def _submit_message(self, body: Dict[str, Any]) -> httpx.Response:
+        sender = body["senderType"]
+        reply_to: Optional[Dict[str, Any]] = None
+        if sender == "BOT":
+            reply_to = self.messages.get(body.get("replyMessageId") or "")
+            if reply_to is None:
+                return _respond(400, {"message": "replyMessageId does not reference a message"})
+            conversation_id = reply_to["conversation"]["id"]
+        else:
+            conversation_id = body.get("conversationId") or str(uuid.uuid4())
+
+        user = self.users.get(body["username"]) or {"userId": None, "username": body["username"]}
+        agent_data = body["agentData"]
+        agent = self.agents.get(agent_data["name"]) or {"id": None, "name": agent_data["name"]}
+
+        message = {
+            "id": str(uuid.uuid4()),
+            "message": body["message"],
+            "sender": sender,
+            "messageType": body.get("messageType", "TEXT"),
+            "user": {"id": user["userId"], "username": user["username"]},
+            "agent": {"id": agent["id"], "name": agent["name"]},
+            "conversation": {"id": conversation_id},
+            "replyToMessage": {"id": reply_to["id"]} if reply_to else None,
+            "agentName": agent["name"],
+            "intent": body.get("intent"),
+            "ragContext": body.get("ragContext"),
+            "timestamp": _now(),
+        }
+        self.messages[message["id"]] = message
+        return _respond(200, {
+            "success": True,
+            "messageId": message["id"],
+            "conversationId": conversation_id,
+            "message": "Message submitted successfully",
+        })
+
+    def _submit_feedback(self, body: Dict[str, Any]) -> httpx.Response:
+        message = self.messages.get(body["messageId"])
+        if message is None or message["sender"] != "BOT":
+            return _respond(400, {"message": "messageId must reference a BOT message"})
+        entry = {"id": str(uuid.uuid4()), "submittedAt": _now(), **body}
+        self.feedback.append(entry)
+        return _respond(200, {
+            "success": True,
+            "feedbackId": entry["id"],
+            "message": "Feedback submitted successfully",
+            "submittedAt": entry["submittedAt"],
+        })
+
+    def _count(self, sender: str) -> int:
+        return sum(1 for m in self.messages.values() if m["sender"] == sender)
+
+    def _totals(self) -> Dict[str, Any]:
+        return {
+            "totalUsers": len(self.users),
+            "totalAgents": len(self.agents),
+            "totalQueries": self._count("HUMAN"),
+            "totalResponses": self._count("BOT"),
+            "totalFeedback": len(self.feedback),
+            "likes": sum(1 for f in self.feedback if f.get("liked")),
+            "dislikes": sum(1 for f in self.feedback if f.get("disliked")),
+            "regenerates": sum(1 for f in self.feedback if f.get("regeneration")),
+        }
+
+    def _queries_by(self, key: str) -> Counter:
+        return Counter(m[key]["name" if key == "agent" else "username"]
+                       for m in self.messages.values() if m["sender"] == "HUMAN")
+
+    def _top_agents(self, limit: int) -> List[Dict[str, Any]]:
+        queries = self._queries_by("agent")
+        ranked = sorted(self.agents.values(), key=lambda a: -queries[a["name"]])[:limit]
+        return [
+            {"rank": rank, "agentName": a["name"], "agentId": a["id"], "queryCount": queries[a["name"]]}
+            for rank, a in enumerate(ranked, 1)
+        ]
+
+    def _top_users(self, limit: int) -> List[Dict[str, Any]]:
+        queries = self._queries_by("user")
+        ranked = sorted(self.users.values(), key=lambda u: -queries[u["username"]])[:limit]
+        return [
+            {"rank": rank, "username": u["username"], "email": u["email"], "userId": u["userId"],
+             "queryCount": queries[u["username"]]}
+            for rank, u in enumerate(ranked, 1)
+        ]
+
+    def _user_analytics(self) -> List[Dict[str, Any]]:
+        counts = Counter((m["user"]["username"], m["sender"]) for m in self.messages.values())
+        return [
+            {"username": u["username"], "email": u["email"], "userId": u["userId"],
+             "queries": counts[(u["username"], "HUMAN")], "responses": counts[(u["username"], "BOT")]}
+            for u in self.users.values()
+        ]
@@ -0,0 +1,223 @@
+"""
+Offline tests for MicroBatcher and the API methods built on it.
+
+Batches are flushed to a recording coroutine, or to an httpx.MockTransport
+handler for the message and conversation APIs.
+"""
+
+import asyncio
+import json
+import uuid
+from typing import List
+
+import httpx
+import pytest
+
+from shiftai import ShiftaiagenticinfraClient
+from shiftai.http import ApiException, BadRequestException
+from shiftai.http.batcher import MicroBatcher
+from shiftai.models import PlatformMessageSubmissionRequest
+
+
+BASE_URL = "https://api.theshiftai.in"
+
+
+class RecordingFlush:
+    """Flush function that records each batch and returns each item times ten."""
+
+    def __init__(self):
+        self.batches: List[list] = []
+
+    async def __call__(self, items: list) -> list:
+        self.batches.append(list(items))
+        return [item * 10 for item in items]
+
+
+async def test_full_batch_is_flushed_without_waiting_for_the_timer():
+    flush = RecordingFlush()
+    batcher = MicroBatcher(flush, max_delay=60.0, max_batch_size=3)
+
+    results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(3))), 1.0)
+
+    assert flush.batches == [[0, 1, 2]]
+    assert results == [0, 10, 20]
+
+
+async def test_partial_batch_is_flushed_by_the_timer():
+    flush = RecordingFlush()
+    batcher = MicroBatcher(flush, max_delay=0.01, max_batch_size=50)
+
+    calls = [asyncio.ensure_future(batcher.submit(i)) for i in (1, 2)]
+    await asyncio.sleep(0)
+    assert flush.batches == [], "Nothing is sent before max_delay has passed"
+
+    assert await asyncio.wait_for(asyncio.gather(*calls), 1.0) == [10, 20]
+    assert flush.batches == [[1, 2]]
+
+
+async def test_items_are_split_into_batches_and_results_returned_to_their_callers():
+    flush = RecordingFlush()
+    batcher = MicroBatcher(flush, max_delay=0.01, max_batch_size=2)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert flush.batches == [[0, 1], [2, 3], [4]]
+    assert results == [0, 10, 20, 30, 40]
+
+
+async def test_later_items_start_a_new_batch():
+    flush = RecordingFlush()
+    batcher = MicroBatcher(flush, max_delay=0.001)
+
+    assert await batcher.submit(1) == 10
+    assert await batcher.submit(2) == 20
+    assert flush.batches == [[1], [2]]
+
+
+async def test_result_count_mismatch_fails_every_caller():
+    async def flush(items: list) -> list:
+        return items[:-1]
+
+    batcher = MicroBatcher(flush, max_delay=0.001)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, ApiException) for result in results), results
+    assert "2 results for 3 items" in str(results[0])
+
+
+async def test_failed_batch_raises_for_every_caller():
+    error = BadRequestException(response_body="bad batch")
+
+    async def flush(items: list) -> list:
+        raise error
+
+    batcher = MicroBatcher(flush, max_delay=0.001)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+    assert results == [error, error, error]
+
+
+async def test_failed_batch_does_not_affect_the_next_one():
+    calls = []
+
+    async def flush(items: list) -> list:
+        calls.append(items)
+        if len(calls) == 1:
+            raise ApiException(500, "boom")
+        return items
+
+    batcher = MicroBatcher(flush, max_delay=0.001)
+    with pytest.raises(ApiException):
+        await batcher.submit("a")
+    assert await batcher.submit("b") == "b"
+
+
+@pytest.mark.parametrize("kwargs", [{"max_delay": -1}, {"max_batch_size": 0}])
+def test_invalid_settings_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        MicroBatcher(RecordingFlush(), **kwargs)
+
+
+def message_request(i: int) -> PlatformMessageSubmissionRequest:
+    return PlatformMessageSubmissionRequest(username=f"user-{i}", message=f"message {i}", senderType="HUMAN")
+
+
+def echo_submission(body) -> dict:
+    """Submission response identifying the message it answers."""
+    return {"success": True, "messageId": str(uuid.uuid5(uuid.NAMESPACE_URL, body["message"])), "message": body["message"]}
+
+
+class SubmitServer:
+    """Message submission endpoints; the batch endpoint can be switched off to return 404."""
+
+    def __init__(self, batch_endpoint: bool = True):
+        self.batch_endpoint = batch_endpoint
+        self.paths: List[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.paths.append(path)
+        body = json.loads(request.content)
+        if path == "/api/platform/messages/submit:batch":
+            if not self.batch_endpoint:
+                return httpx.Response(404, json={"message": "Not found"})
+            return httpx.Response(200, json=[echo_submission(item) for item in body])
+        if path == "/api/platform/messages/submit":
+            return httpx.Response(200, json=echo_submission(body))
+        return httpx.Response(404)
+
+
+def submit_client(server: SubmitServer) -> ShiftaiagenticinfraClient:
+    return ShiftaiagenticinfraClient(base_url=BASE_URL, api_key="k1", transport=httpx.MockTransport(server))
+
+
+async def test_batch_submit_uses_the_batch_endpoint():
+    server = SubmitServer()
+    async with submit_client(server) as client:
+        responses = await client.messages.batch_submit([message_request(i) for i in range(3)])
+
+    assert server.paths == ["/api/platform/messages/submit:batch"]
+    assert [r.message for r in responses] == ["message 0", "message 1", "message 2"]
+
+
+async def test_batch_submit_falls_back_to_single_requests_on_404():
+    server = SubmitServer(batch_endpoint=False)
+    async with submit_client(server) as client:
+        responses = await client.messages.batch_submit([message_request(i) for i in range(3)])
+
+    assert server.paths[0] == "/api/platform/messages/submit:batch"
+    assert server.paths[1:] == ["/api/platform/messages/submit"] * 3
+    assert [r.message for r in responses] == ["message 0", "message 1", "message 2"], "Order should be kept"
+
+
+async def test_batch_submit_of_nothing_sends_no_request():
+    server = SubmitServer()
+    async with submit_client(server) as client:
+        assert await client.messages.batch_submit([]) == []
+    assert server.paths == []
+
+
+async def test_enable_batching_coalesces_concurrent_messages():
+    server = SubmitServer()
+    async with submit_client(server) as client:
+        client.messages.enable_batching(max_delay=0.01)
+        responses = await asyncio.gather(*(client.messages.submit(message_request(i)) for i in range(4)))
+
+    assert server.paths == ["/api/platform/messages/submit:batch"]
+    assert [r.message for r in responses] == [f"message {i}" for i in range(4)]
+
+
+async def test_conversation_batching_returns_each_callers_messages():
+    first, second = uuid.uuid4(), uuid.uuid4()
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append((request.url.path, body))
+        return httpx.Response(200, json={
+            conversation_id: [{"message": f"{conversation_id}-{n}"} for n in range(2)]
+            for conversation_id in body["conversationIds"]
+        })
+
+    async with ShiftaiagenticinfraClient(
+        base_url=BASE_URL,
+        api_key="k1",
+        transport=httpx.MockTransport(handler)
+    ) as client:
+        client.conversations.enable_batching(max_delay=0.01)
+        results = await asyncio.gather(
+            client.conversations.get_messages_by_conversation_id(first),
+            client.conversations.get_messages_by_conversation_id(second),
+            client.conversations.get_messages_by_conversation_id(first),
+        )
+
+    assert requests == [(
+        "/api/platform/conversation/getmessages-batch",
+        {"conversationIds": [str(first), str(second)]},
+    )], "Duplicate IDs should be sent once"
+    assert [[m.message for m in messages] for messages in results] == [
+        [f"{first}-0", f"{first}-1"],
+        [f"{second}-0", f"{second}-1"],
+        [f"{first}-0", f"{first}-1"],
+    ]
+    assert results[0] is not results[2], "Callers asking for the same conversation get separate lists"
@@ -0,0 +1,156 @@
+"""
+Offline tests for client behaviour that does not depend on server data.
+
+Requests are answered by an httpx.MockTransport handler defined in each test.
+"""
+
+import asyncio
+import json
+import uuid
+
+import httpx
+import pytest
+
+from shiftai import ShiftaiagenticinfraClient
+from shiftai.http import NotFoundException
+
+
+BASE_URL = "https://api.theshiftai.in"
+
+
+async def test_changing_api_key_drops_cached_responses():
+    """A response cached under one API key is not served after the key changes."""
+    sent_keys = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.headers.get("Api-Key")
+        sent_keys.append(key)
+        return httpx.Response(200, json={"totalUsers": len(key)})
+
+    async with ShiftaiagenticinfraClient(
+        base_url=BASE_URL,
+        api_key="k1",
+        cache_ttl=60.0,
+        transport=httpx.MockTransport(handler)
+    ) as client:
+        first = await client.analytics.get_dashboard()
+        cached = await client.analytics.get_dashboard()
+        assert sent_keys == ["k1"], "Second read should be served from the cache"
+        assert cached == first
+
+        client.api_key = "key-2"
+        assert client.api_key == "key-2"
+        assert client._http_client.api_key == "key-2"
+
+        second = await client.analytics.get_dashboard()
+        assert sent_keys == ["k1", "key-2"], "Read after the key change should go to the server"
+        assert second.totalUsers == len("key-2"), "Response cached under the old key should not be served"
+
+
+async def test_changing_api_key_drops_cached_messages():
+    """Messages and 404s remembered by messages.get_by_id under one key are forgotten when the key changes."""
+    found_id, missing_id = uuid.uuid4(), uuid.uuid4()
+    projects = {
+        "k1": {str(found_id): "from k1"},
+        "k2": {str(found_id): "from k2", str(missing_id): "only in k2"},
+    }
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.headers.get("Api-Key")
+        message_id = request.url.path.rsplit("/", 1)[1]
+        sent.append((key, message_id))
+        text = projects[key].get(message_id)
+        if text is None:
+            return httpx.Response(404, json={"message": "Message not found"})
+        return httpx.Response(200, json={"id": message_id, "message": text})
+
+    async with ShiftaiagenticinfraClient(
+        base_url=BASE_URL,
+        api_key="k1",
+        message_cache_size=16,
+        not_found_ttl=60.0,
+        transport=httpx.MockTransport(handler)
+    ) as client:
+        assert (await client.messages.get_by_id(found_id)).message == "from k1"
+        for _ in range(2):
+            with pytest.raises(NotFoundException):
+                await client.messages.get_by_id(missing_id)
+        assert (await client.messages.get_by_id(found_id)).message == "from k1"
+        assert len(sent) == 2, "Repeated lookups under k1 should be served from the caches"
+
+        client.api_key = "k2"
+
+        assert (await client.messages.get_by_id(found_id)).message == "from k2", \
+            "Message cached under the old key should not be served"
+        assert (await client.messages.get_by_id(missing_id)).message == "only in k2", \
+            "404 remembered under the old key should not be raised"
+        assert sent[2:] == [("k2", str(found_id)), ("k2", str(missing_id))]
+
+
+async def test_cached_message_is_copied_per_caller():
+    """Changing a message returned by get_by_id does not change what later calls get from the cache."""
+    message_id = uuid.uuid4()
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"id": str(message_id), "message": "original"})
+    )
+
+    async with ShiftaiagenticinfraClient(
+        base_url=BASE_URL,
+        api_key="k1",
+        message_cache_size=16,
+        transport=transport
+    ) as client:
+        fetched = await client.messages.get_by_id(message_id)
+        fetched.message = "changed by caller"
+        cached = await client.messages.get_by_id(message_id)
+        assert cached.message == "original"
+        cached.message = "changed again"
+        assert (await client.messages.get_by_id(message_id)).message == "original"
+
+
+async def test_submit_feedback_and_fetch_includes_concurrent_submissions():
+    """Feedback lists read before or during submissions are not served stale afterwards."""
+    message_id = uuid.uuid4()
+    path = f"/api/analytics/messages/{message_id}/feedback"
+    feedback = []
+    stale_read = asyncio.Event()
+    gets = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal gets
+        if request.method == "POST":
+            await asyncio.sleep(0)
+            entry = {"id": str(uuid.uuid4()), "feedbackTitle": json.loads(request.content)["feedbackTitle"]}
+            feedback.insert(0, entry)
+            return httpx.Response(200, json={"success": True, "feedbackId": entry["id"]})
+        assert request.url.path == path
+        gets += 1
+        snapshot = list(feedback)
+        if gets == 1:
+            # The first read was sent before any submission; hold its answer until they are done
+            await stale_read.wait()
+        return httpx.Response(200, json=snapshot)
+
+    async with ShiftaiagenticinfraClient(
+        base_url=BASE_URL,
+        api_key="k1",
+        cache_ttl=60.0,
+        transport=httpx.MockTransport(handler)
+    ) as client:
+        early = asyncio.ensure_future(client.analytics.get_message_feedback(message_id))
+        await asyncio.sleep(0.01)
+
+        # Joining the held read would never finish, so bound the wait
+        first, second = await asyncio.wait_for(asyncio.gather(
+            client.analytics.submit_feedback_and_fetch(message_id, "first", "good"),
+            client.analytics.submit_feedback_and_fetch(message_id, "second", "bad"),
+        ), timeout=5)
+        stale_read.set()
+        assert await early == []
+
+        assert "first" in [f.feedbackTitle for f in first]
+        assert "second" in [f.feedbackTitle for f in second]
+        latest = await client.analytics.get_message_feedback(message_id)
+        assert sorted(f.feedbackTitle for f in latest) == ["first", "second"], \
+            "The cache should not keep a list read before a submission"
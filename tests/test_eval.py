@@ -0,0 +1,139 @@
+"""
+Offline tests for polling batch metrics progress (internal eval API).
+
+Progress responses are served by an httpx.MockTransport handler from a
+fixed script; the delays between polls are recorded instead of slept.
+"""
+
+import asyncio
+import types
+from typing import List, Optional, Tuple
+
+import httpx
+import pytest
+
+from shiftai import ShiftaiagenticinfraClient
+from shiftai.api.internal import trulens_api
+from shiftai.http import ApiException
+
+
+BASE_URL = "https://api.theshiftai.in"
+
+PROGRESS_PATH = "/api/eval/sessions/generate-metrics-all/job-1/progress"
+
+
+class ProgressServer:
+    """Serves one scripted (status, ETag, body) response per poll and records the If-None-Match sent."""
+
+    def __init__(self, script: List[Tuple[int, Optional[str], Optional[dict]]]):
+        self.script = script
+        self.if_none_match: List[Optional[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == PROGRESS_PATH
+        self.if_none_match.append(request.headers.get("If-None-Match"))
+        status, etag, body = self.script[min(len(self.if_none_match), len(self.script)) - 1]
+        headers = {"ETag": etag} if etag else {}
+        if body is None:
+            return httpx.Response(status, headers=headers)
+        return httpx.Response(status, json=body, headers=headers)
+
+
+@pytest.fixture
+def delays(monkeypatch) -> List[float]:
+    """Record the delays the poller asks for, without sleeping for them."""
+    recorded: List[float] = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay: float) -> None:
+        recorded.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(trulens_api, "asyncio", types.SimpleNamespace(sleep=sleep))
+    return recorded
+
+
+def finished(progress: dict) -> bool:
+    return progress.get("status") == "COMPLETED"
+
+
+async def poll(server: ProgressServer, **kwargs) -> List[dict]:
+    async with ShiftaiagenticinfraClient(base_url=BASE_URL, transport=httpx.MockTransport(server)) as client:
+        return [
+            progress
+            async for progress in client.internal.eval.iter_batch_progress(
+                "job-1", until=finished, min_interval=0.1, max_interval=1.0, **kwargs
+            )
+        ]
+
+
+async def test_polls_conditionally_on_the_last_etag(delays):
+    server = ProgressServer([
+        (200, '"v1"', {"processed": 1}),
+        (304, '"v1"', None),
+        (304, '"v1"', None),
+        (200, '"v2"', {"processed": 2}),
+        (200, '"v3"', {"processed": 3, "status": "COMPLETED"}),
+    ])
+
+    assert await poll(server) == [{"processed": 1}, {"processed": 2}, {"processed": 3, "status": "COMPLETED"}]
+    assert server.if_none_match == [None, '"v1"', '"v1"', '"v1"', '"v2"']
+    # Doubling while unchanged (304s), back to min_interval after each change
+    assert delays == [0.1, 0.2, 0.4, 0.1]
+
+
+async def test_back_off_is_capped_at_max_interval(delays):
+    server = ProgressServer([(200, '"v1"', {"processed": 1})] + [(304, '"v1"', None)] * 6 + [
+        (200, '"v2"', {"status": "COMPLETED"}),
+    ])
+
+    await poll(server)
+    assert delays == [0.1, 0.2, 0.4, 0.8, 1.0, 1.0, 1.0]
+
+
+async def test_without_etag_unchanged_progress_is_not_repeated(delays):
+    server = ProgressServer([
+        (200, None, {"processed": 1}),
+        (200, None, {"processed": 1}),
+        (200, None, {"processed": 1}),
+        (200, None, {"processed": 2, "status": "COMPLETED"}),
+    ])
+
+    assert await poll(server) == [{"processed": 1}, {"processed": 2, "status": "COMPLETED"}]
+    assert server.if_none_match == [None] * 4, "No ETag was sent, so polls are unconditional"
+    assert delays == [0.1, 0.2, 0.4]
+
+
+async def test_stops_only_when_until_is_satisfied(delays):
+    server = ProgressServer([(200, None, {"processed": n}) for n in range(1, 4)])
+
+    async with ShiftaiagenticinfraClient(base_url=BASE_URL, transport=httpx.MockTransport(server)) as client:
+        seen = []
+        async for progress in client.internal.eval.iter_batch_progress("job-1", min_interval=0.1):
+            seen.append(progress)
+            if len(seen) == 3:
+                break
+    assert seen == [{"processed": 1}, {"processed": 2}, {"processed": 3}]
+
+
+async def test_malformed_body_raises_api_exception(delays):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"{not json")
+
+    async with ShiftaiagenticinfraClient(base_url=BASE_URL, transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(ApiException):
+            async for _ in client.internal.eval.iter_batch_progress("job-1"):
+                pass
+
+
+async def test_error_status_raises_api_exception(delays):
+    server = ProgressServer([(500, None, {"message": "boom"})])
+    with pytest.raises(ApiException):
+        await poll(server)
+
+
+@pytest.mark.parametrize("min_interval, max_interval", [(0, 1.0), (2.0, 1.0)])
+def test_invalid_intervals_raise_on_call(min_interval, max_interval):
+    client = ShiftaiagenticinfraClient(base_url=BASE_URL, transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    with pytest.raises(ValueError):
+        client.internal.eval.iter_batch_progress("job-1", min_interval=min_interval, max_interval=max_interval)
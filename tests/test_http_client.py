@@ -0,0 +1,210 @@
+"""
+Offline tests for HttpClient's request coalescing and concurrency limit.
+
+Requests are answered by an httpx.MockTransport handler defined in each test.
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Optional
+
+import httpx
+import pytest
+
+from shiftai import ShiftaiagenticinfraClient
+
+
+BASE_URL = "https://api.theshiftai.in"
+
+
+class SlowServer:
+    """Handler that holds each request until it is released and records the peak concurrency."""
+
+    def __init__(self):
+        self.held: Deque[asyncio.Event] = deque()
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+
+    def release(self, count: Optional[int] = None) -> None:
+        """Let the `count` oldest held requests respond (default: all of them, and any later ones)."""
+        if count is None:
+            self.release_all = True
+            count = len(self.held)
+        for _ in range(count):
+            self.held.popleft().set()
+
+    release_all = False
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if not self.release_all:
+                gate = asyncio.Event()
+                self.held.append(gate)
+                await gate.wait()
+        finally:
+            self.active -= 1
+        return httpx.Response(200, json={"path": request.url.path})
+
+
+def make_client(server: SlowServer, **kwargs) -> ShiftaiagenticinfraClient:
+    return ShiftaiagenticinfraClient(
+        base_url=BASE_URL,
+        api_key="k1",
+        transport=httpx.MockTransport(server),
+        **kwargs
+    )
+
+
+async def wait_until(predicate, ticks: int = 50) -> None:
+    """Let the event loop run until predicate() holds."""
+    for _ in range(ticks):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    pytest.fail("Condition not reached")
+
+
+async def test_identical_gets_share_one_request():
+    server = SlowServer()
+    async with make_client(server) as client:
+        http = client._http_client
+        calls = [asyncio.ensure_future(http.get("/a", dict)) for _ in range(3)]
+        await wait_until(lambda: server.requests == 1)
+        server.release()
+        results = await asyncio.gather(*calls)
+
+    assert server.requests == 1
+    assert results == [{"path": "/a"}] * 3
+    assert results[0] is not results[1], "Each caller should get its own copy"
+
+
+async def test_get_after_last_waiter_cancelled_starts_a_new_request():
+    """An identical GET issued while the cancelled shared request is winding down must not inherit its cancellation."""
+    server = SlowServer()
+    async with make_client(server) as client:
+        http = client._http_client
+        first = asyncio.ensure_future(http.get("/a", dict))
+        await wait_until(lambda: server.requests == 1)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(http.get("/a", dict))
+        await wait_until(lambda: server.requests == 2)
+        server.release()
+
+        assert await second == {"path": "/a"}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+def distinct_gets(client: ShiftaiagenticinfraClient, count: int) -> list:
+    """Start `count` GETs to different paths, so none of them are coalesced."""
+    return [asyncio.ensure_future(client._http_client.get(f"/r{i}", dict)) for i in range(count)]
+
+
+async def test_max_in_flight_caps_concurrent_requests():
+    server = SlowServer()
+    async with make_client(server, max_in_flight=2) as client:
+        calls = distinct_gets(client, 6)
+        await wait_until(lambda: server.active == 2)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert server.active == 2, "Only max_in_flight requests should reach the transport"
+
+        # Complete the requests one at a time; each completion admits exactly one waiter
+        for remaining in range(6, 0, -1):
+            await wait_until(lambda: server.active == len(server.held) == min(2, remaining))
+            server.release(1)
+        results = await asyncio.gather(*calls)
+
+    assert server.peak == 2
+    assert results == [{"path": f"/r{i}"} for i in range(6)], "Waiters should be served in order"
+    assert client._http_client._limiter.active == 0
+
+
+async def test_raising_the_limit_admits_waiting_requests():
+    server = SlowServer()
+    async with make_client(server, max_in_flight=1) as client:
+        calls = distinct_gets(client, 4)
+        await wait_until(lambda: server.active == 1)
+
+        client.set_max_in_flight(3)
+        await wait_until(lambda: server.active == 3)
+
+        server.release()
+        await asyncio.gather(*calls)
+    assert server.peak == 3
+
+
+async def test_lowering_the_limit_lets_in_flight_requests_drain():
+    server = SlowServer()
+    async with make_client(server, max_in_flight=3) as client:
+        calls = distinct_gets(client, 5)
+        await wait_until(lambda: server.active == 3)
+
+        client.set_max_in_flight(1)
+        assert server.active == 3, "Requests already in flight are not interrupted"
+
+        # Two completions only bring the count down to the new limit; no waiter is admitted
+        server.release(2)
+        await wait_until(lambda: server.active == 1)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert server.active == 1 and server.requests == 3
+
+        # From now on the waiters are admitted one at a time
+        for expected in (4, 5):
+            server.release(1)
+            await wait_until(lambda: server.requests == expected)
+            assert server.active == 1
+        server.release()
+        await asyncio.gather(*calls)
+
+
+async def test_set_max_in_flight_rejects_values_below_one():
+    async with make_client(SlowServer()) as client:
+        with pytest.raises(ValueError):
+            client.set_max_in_flight(0)
+
+
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    server = SlowServer()
+    async with make_client(server, max_in_flight=1) as client:
+        limiter = client._http_client._limiter
+        first, second, third = distinct_gets(client, 3)
+        await wait_until(lambda: server.active == 1)
+
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        assert len(limiter._waiters) == 1, "The cancelled waiter should leave the queue"
+
+        server.release()
+        assert await first == {"path": "/r0"}
+        assert await third == {"path": "/r2"}
+        assert server.requests == 2
+        assert limiter.active == 0
+
+
+async def test_slot_granted_to_a_cancelled_waiter_is_passed_on():
+    async with make_client(SlowServer(), max_in_flight=1) as client:
+        limiter = client._http_client._limiter
+        await limiter.acquire()
+        granted = asyncio.ensure_future(limiter.acquire())
+        next_in_line = asyncio.ensure_future(limiter.acquire())
+        await wait_until(lambda: len(limiter._waiters) == 2)
+
+        # Hand the slot to `granted`, then cancel it before it gets to run
+        limiter.release()
+        granted.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await granted
+
+        await asyncio.wait_for(next_in_line, 1.0)
+        assert limiter.active == 1, "The slot should have moved on to the next waiter"
+        limiter.release()
+        assert limiter.active == 0
@@ -0,0 +1,182 @@
+"""
+Offline tests for the incremental JSON array decoder behind the stream_* methods.
+
+Every body is decoded whole, in 1-byte chunks and in a few other chunk sizes,
+and the result must equal json.loads() of the whole body.
+"""
+
+import asyncio
+import json
+import uuid
+from typing import AsyncIterator, List
+
+import httpx
+import pytest
+
+from shiftai import ShiftaiagenticinfraClient
+from shiftai.http import ApiException
+from shiftai.http.streaming import iter_json_array
+
+
+BASE_URL = "https://api.theshiftai.in"
+
+CHUNK_SIZES = [1, 2, 3, 7, 64, None]  # None: the whole body as one chunk
+
+VALID_BODIES = {
+    "empty": b"[]",
+    "empty_with_whitespace": b" \n[ \t\r\n] \n",
+    "objects": json.dumps([{"id": i, "message": f"m{i}", "tags": ["a", "b"]} for i in range(5)]).encode(),
+    "brackets_and_commas_in_strings": json.dumps(["a]b", "c,d", "[", "]", ",", '\\"],[{'], separators=(",", ":")).encode(),
+    "nested": json.dumps([[[]], {"a": {"b": [1, {"c": "]"}]}}, []]).encode(),
+    "numbers": b"[0,-1,12345678901234567890,-1.5e-3,3.14159,2E10,-0.0]",
+    "literals": b"[true, false, null,true]",
+    "escapes": json.dumps(["tab\tnewline\n", "quote\"backslash\\", "\u0000\u001f"]).encode(),
+    "multibyte_utf8": json.dumps(["héllo", "日本語テキスト", "emoji 🎉🚀", {"ключ": "значение"}], ensure_ascii=False).encode(),
+    "pretty_printed": json.dumps([{"id": 1, "nested": {"x": [1, 2]}}, 42, "s"], indent=2).encode(),
+}
+
+INVALID_BODIES = {
+    "not_an_array": b'{"a": 1}',
+    "truncated_element": b'[{"a": 1}, {"b": ',
+    "missing_close": b"[1, 2, 3",
+    "truncated_string": b'["abc',
+    "missing_comma": b"[1 2]",
+    "trailing_comma": b"[1, 2,]",
+    "leading_comma": b"[,1]",
+    "trailing_data": b"[1, 2] 3",
+    "bad_literal": b"[tru]",
+    "empty_body": b"",
+}
+
+
+def chunked(body: bytes, size) -> List[bytes]:
+    if size is None:
+        return [body]
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+async def aiter_chunks(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def decode(body: bytes, size) -> list:
+    return [item async for item in iter_json_array(aiter_chunks(chunked(body, size)))]
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize("name", sorted(VALID_BODIES))
+async def test_matches_json_loads(name, size):
+    body = VALID_BODIES[name]
+    assert await decode(body, size) == json.loads(body)
+
+
+@pytest.mark.parametrize("size", [1, 4])
+async def test_number_split_across_chunks_is_not_cut_short(size):
+    """A number ending at a chunk boundary may continue in the next chunk (e.g. "-1." + "5")."""
+    body = b"[-1.5,1234567,3e10]"
+    assert await decode(body, size) == [-1.5, 1234567, 3e10]
+
+
+async def test_multibyte_character_split_between_chunks():
+    text = "日本"
+    body = json.dumps([text], ensure_ascii=False).encode()
+    split = body.index(text.encode()) + 1  # inside the first character's 3-byte sequence
+    result = [item async for item in iter_json_array(aiter_chunks([body[:split], body[split:]]))]
+    assert result == [text]
+
+
+@pytest.mark.parametrize("size", [1, 3, None])
+@pytest.mark.parametrize("name", sorted(INVALID_BODIES))
+async def test_malformed_body_raises_api_exception(name, size):
+    with pytest.raises(ApiException):
+        await decode(INVALID_BODIES[name], size)
+
+
+async def test_elements_are_yielded_before_the_body_is_complete():
+    received = []
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b'[{"a": 1},'
+        assert received == [{"a": 1}], "First element should be yielded before more data arrives"
+        yield b' {"b": 2}]'
+
+    async for item in iter_json_array(chunks()):
+        received.append(item)
+    assert received == [{"a": 1}, {"b": 2}]
+
+
+class TrackedStream(httpx.AsyncByteStream):
+    """Response body sent in small chunks that records whether it was closed."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in chunked(self.body, 16):
+            await asyncio.sleep(0)
+            yield chunk
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+MESSAGES_BODY = json.dumps([{"id": str(uuid.uuid4()), "message": f"m{i}"} for i in range(10)]).encode()
+
+
+def streaming_client(streams: List[TrackedStream]) -> ShiftaiagenticinfraClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        stream = TrackedStream(MESSAGES_BODY)
+        streams.append(stream)
+        return httpx.Response(200, stream=stream)
+
+    return ShiftaiagenticinfraClient(
+        base_url=BASE_URL,
+        api_key="k1",
+        max_in_flight=1,
+        transport=httpx.MockTransport(handler)
+    )
+
+
+async def test_stream_yields_all_messages_and_releases_when_exhausted():
+    streams: List[TrackedStream] = []
+    async with streaming_client(streams) as client:
+        messages = [message async for message in client.messages.iter_all()]
+        assert [m.message for m in messages] == [f"m{i}" for i in range(10)]
+        assert streams[0].closed
+        assert client._http_client._limiter.active == 0
+
+
+async def test_break_inside_async_with_releases_connection_and_slot():
+    streams: List[TrackedStream] = []
+    async with streaming_client(streams) as client:
+        limiter = client._http_client._limiter
+        async with client.messages.iter_all() as messages:
+            async for _ in messages:
+                assert limiter.active == 1
+                break
+        assert streams[0].closed, "Leaving the block should close the response"
+        assert limiter.active == 0, "Leaving the block should release the in-flight slot"
+
+        # With max_in_flight=1, a leaked slot would block this request forever
+        assert len(await asyncio.wait_for(client.messages.get_all(), 1.0)) == 10
+
+
+async def test_aclose_releases_connection_and_slot():
+    streams: List[TrackedStream] = []
+    async with streaming_client(streams) as client:
+        stream = client.messages.iter_all()
+        await stream.__anext__()
+        await stream.aclose()
+        await stream.aclose()  # closing again is a no-op
+        assert streams[0].closed
+        assert client._http_client._limiter.active == 0
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+
+
+async def test_invalid_uuid_raises_on_call():
+    async with streaming_client([]) as client:
+        with pytest.raises(ValueError):
+            client.messages.iter_by_agent("not-a-uuid")